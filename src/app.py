@@ -15,6 +15,7 @@ from .infrastructure.database.connection import init_db, db_session
 from .infrastructure.repositories.user_repository_impl import UserRepositoryImpl
 from .infrastructure.repositories.thesis_repository_impl import ThesisRepositoryImpl
 from .infrastructure.repositories.feedback_repository_impl import FeedbackRepositoryImpl
+from .infrastructure.repositories.notification_repository_impl import NotificationRepositoryImpl
 
 # Import services
 from .infrastructure.services.jwt_service import JwtService
@@ -42,7 +43,7 @@ from .api.routes.admin_routes import create_admin_routes
 from .api.error_handlers import register_error_handlers
 
 
-def create_app(testing=False):
+def create_app(testing=False, mocks=None):
     """Create and configure the Flask application"""
     app = Flask(__name__)
 
@@ -51,6 +52,9 @@ def create_app(testing=False):
     app.config["DEBUG"] = os.getenv("DEBUG", "False").lower() in ["true", "1", "yes"]
     app.config["TESTING"] = testing
 
+    # Dependencies supplied by tests, keyed by name, take precedence below
+    app.config["TESTING_MOCKS"] = mocks = mocks or {}
+
     # Setup CORS
     CORS(app, resources={r"/api/*": {"origins": "*"}})
 
@@ -61,9 +65,10 @@ def create_app(testing=False):
     migrate = Migrate(app, db_session)
 
     # Setup repositories
-    user_repository = UserRepositoryImpl(db_session)
-    thesis_repository = ThesisRepositoryImpl(db_session)
-    feedback_repository = FeedbackRepositoryImpl(db_session)
+    user_repository = mocks.get("user_repository") or UserRepositoryImpl(db_session)
+    thesis_repository = mocks.get("thesis_repository") or ThesisRepositoryImpl(db_session)
+    feedback_repository = mocks.get("feedback_repository") or FeedbackRepositoryImpl(db_session)
+    notification_repository = mocks.get("notification_repository") or NotificationRepositoryImpl(db_session)
 
     # Setup password hashing service
     class PasswordHashService:
@@ -76,13 +81,14 @@ def create_app(testing=False):
     password_service = PasswordHashService()
 
     # Setup services
-    jwt_service = JwtService(user_repository, password_service)
-    storage_service = CloudinaryStorageService()
-    pdf_service = PdfService(storage_service)
-    notification_service = EmailNotificationService(
+    jwt_service = mocks.get("jwt_service") or JwtService(user_repository, password_service)
+    storage_service = mocks.get("storage_service") or CloudinaryStorageService()
+    pdf_service = mocks.get("pdf_service") or PdfService(storage_service)
+    notification_service = mocks.get("notification_service") or EmailNotificationService(
         user_repository=user_repository,
         thesis_repository=thesis_repository,
-        feedback_repository=feedback_repository
+        feedback_repository=feedback_repository,
+        notification_repository=notification_repository
     )
 
     # Setup use cases
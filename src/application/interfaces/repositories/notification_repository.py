@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+from uuid import UUID
+
+
+class NotificationRepository(ABC):
+    """Interface for notification repository operations"""
+
+    @abstractmethod
+    def create(self, notification: Dict) -> Dict:
+        """Create a new notification"""
+        pass
+
+    @abstractmethod
+    def create_many(self, notifications: List[Dict]) -> int:
+        """Create several notifications in one batch, returns count"""
+        pass
+
+    @abstractmethod
+    def get_by_user(self, user_id: UUID, limit: int = 20, offset: int = 0) -> List[Dict]:
+        """Get notifications for a user (newest first) with pagination"""
+        pass
+
+    @abstractmethod
+    def mark_as_read(self, notification_id: UUID) -> bool:
+        """Mark a notification as read"""
+        pass
+
+    @abstractmethod
+    def mark_all_as_read(self, user_id: UUID) -> int:
+        """Mark all notifications as read for a user, returns count"""
+        pass
+
+    @abstractmethod
+    def count_unread(self, user_id: UUID) -> int:
+        """Get count of unread notifications for a user"""
+        pass
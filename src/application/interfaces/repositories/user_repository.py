@@ -14,6 +14,11 @@ class UserRepository(ABC):
         """Create a new user"""
         pass
 
+    @abstractmethod
+    def create_many(self, users: List[User]) -> List[User]:
+        """Create several users in one batch"""
+        pass
+
     @abstractmethod
     def get_by_id(self, user_id: UUID) -> Optional[User]:
         """Get a user by ID"""
@@ -14,6 +14,12 @@ class NotificationService(ABC):
         """Send an email notification"""
         pass
 
+    @abstractmethod
+    def send_bulk(self, recipient_emails: List[str], subject: str, body: str,
+                  html_body: Optional[str] = None) -> bool:
+        """Send the same email to several recipients"""
+        pass
+
     @abstractmethod
     def send_notification(self, user_id: UUID, notification_type: NotificationType,
                           data: Dict[str, Any], send_email: bool = True) -> bool:
@@ -33,11 +33,11 @@ class StorageService(ABC):
         pass
 
     @abstractmethod
-    def validate_file(self, file_data: BinaryIO, file_name: str) -> Tuple[bool, str]:
+    def validate_file(self, file_data: BinaryIO, file_name: str) -> Tuple[bool, str, int]:
         """
         Validate a file (type, size, content, etc.)
         
         Returns:
-            Tuple of (is_valid, error_message)
+            Tuple of (is_valid, error_message, file_size)
         """
         pass
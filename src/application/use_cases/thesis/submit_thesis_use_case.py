@@ -78,7 +78,7 @@ class SubmitThesisUseCase:
         file_info = None
         if file_data and file_name:
             # Validate file
-            is_valid, error_message = self.storage_service.validate_file(
+            is_valid, error_message, _ = self.storage_service.validate_file(
                 file_data, file_name)
             if not is_valid:
                 raise ValidationException(f"Invalid file: {error_message}")
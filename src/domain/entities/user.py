@@ -1,3 +1,4 @@
+import hmac
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional
@@ -25,6 +26,26 @@ class User:
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: Optional[datetime] = None
 
+    @classmethod
+    def from_row(cls, row) -> "User":
+        """Create a user from a row with column-named fields"""
+        return cls(
+            id=UUID(row.id),
+            email=row.email,
+            first_name=row.first_name,
+            last_name=row.last_name,
+            role=UserRole(row.role),
+            password_hash=row.password_hash,
+            department=row.department,
+            student_id=row.student_id,
+            is_active=row.is_active,
+            email_verified=row.email_verified,
+            verification_code=row.verification_code,
+            verification_code_expiry=row.verification_code_expiry,
+            created_at=row.created_at,
+            updated_at=row.updated_at
+        )
+
     def __post_init__(self):
         self._validate()
 
@@ -91,7 +112,7 @@ class User:
             return False
         
         # Check if code is valid and not expired
-        if (self.verification_code == code and 
+        if (self._code_matches(code) and 
             self.verification_code_expiry > datetime.utcnow()):
             self.email_verified = True
             self.verification_code = None
@@ -114,13 +135,18 @@ class User:
         self.verification_code_expiry = datetime.utcnow().replace(microsecond=0) + timedelta(hours=expiry_hours)
         self.updated_at = datetime.utcnow()
         
+    def _code_matches(self, code: str) -> bool:
+        """Compare a code with the stored one in constant time"""
+        return hmac.compare_digest(self.verification_code.encode("utf-8"),
+                                   str(code).encode("utf-8"))
+
     def verify_password_reset_code(self, code: str) -> bool:
         """Verify password reset code"""
         if not self.verification_code or not self.verification_code_expiry:
             return False
         
         # Check if code is valid and not expired
-        if (self.verification_code == code and 
+        if (self._code_matches(code) and 
             self.verification_code_expiry > datetime.utcnow()):
             # Keep the code valid for now, it will be cleared when password is reset
             return True
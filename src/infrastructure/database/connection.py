@@ -41,6 +41,7 @@ def init_db():
     from .models.user_model import UserModel
     from .models.thesis_model import ThesisModel
     from .models.feedback_model import FeedbackModel
+    from .models.notification_model import NotificationModel
 
     # Create tables
     Base.metadata.create_all(bind=engine)
@@ -0,0 +1,48 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, Boolean, DateTime, Enum, ForeignKey, JSON
+from sqlalchemy.dialects.mysql import CHAR
+
+from src.infrastructure.database.connection import Base
+from src.domain.value_objects.status import NotificationType
+
+
+class NotificationModel(Base):
+    """SQLAlchemy model for notifications"""
+    __tablename__ = "notifications"
+
+    id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(CHAR(36), ForeignKey(
+        "users.id"), nullable=False, index=True)
+    type = Column(Enum(*NotificationType.values()), nullable=False)
+    data = Column(JSON, nullable=True)
+    is_read = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+    def to_dict(self):
+        """Convert model to a notification record"""
+        return {
+            "id": uuid.UUID(self.id),
+            "user_id": uuid.UUID(self.user_id),
+            "type": self.type,
+            "data": self.data or {},
+            "is_read": self.is_read,
+            "created_at": self.created_at
+        }
+
+    @staticmethod
+    def mapping_from_dict(notification):
+        """Create a column mapping from a notification record (usable for bulk inserts)"""
+        return {
+            "id": str(notification["id"]),
+            "user_id": str(notification["user_id"]),
+            "type": notification["type"],
+            "data": notification.get("data"),
+            "is_read": notification.get("is_read", False),
+            "created_at": notification.get("created_at")
+        }
+
+    @classmethod
+    def from_dict(cls, notification):
+        """Create model from a notification record"""
+        return cls(**cls.mapping_from_dict(notification))
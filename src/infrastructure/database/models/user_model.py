@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, Enum
+from sqlalchemy import Column, String, Boolean, DateTime, Enum, Index
 from sqlalchemy.dialects.mysql import CHAR
 
 from src.infrastructure.database.connection import Base
@@ -10,6 +10,10 @@ from src.domain.value_objects.status import UserRole
 class UserModel(Base):
     """SQLAlchemy model for users"""
     __tablename__ = "users"
+    __table_args__ = (
+        # Supports advisor lookups by department
+        Index("ix_user_role_dept_active", "role", "department", "is_active"),
+    )
 
     id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     email = Column(String(255), unique=True, nullable=False, index=True)
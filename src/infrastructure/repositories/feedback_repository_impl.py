@@ -42,8 +42,7 @@ class FeedbackRepositoryImpl(FeedbackRepository):
 
     def get_by_id(self, feedback_id: UUID) -> Optional[Feedback]:
         """Get a feedback by ID"""
-        feedback_model = self.session.query(FeedbackModel).filter(
-            FeedbackModel.id == str(feedback_id)).first()
+        feedback_model = self.session.get(FeedbackModel, str(feedback_id))
 
         if not feedback_model:
             return None
@@ -52,8 +51,7 @@ class FeedbackRepositoryImpl(FeedbackRepository):
 
     def update(self, feedback: Feedback) -> Feedback:
         """Update a feedback"""
-        feedback_model = self.session.query(FeedbackModel).filter(
-            FeedbackModel.id == str(feedback.id)).first()
+        feedback_model = self.session.get(FeedbackModel, str(feedback.id))
 
         if not feedback_model:
             raise EntityNotFoundException("Feedback", feedback.id)
@@ -85,8 +83,7 @@ class FeedbackRepositoryImpl(FeedbackRepository):
 
     def delete(self, feedback_id: UUID) -> bool:
         """Delete a feedback"""
-        feedback_model = self.session.query(FeedbackModel).filter(
-            FeedbackModel.id == str(feedback_id)).first()
+        feedback_model = self.session.get(FeedbackModel, str(feedback_id))
 
         if not feedback_model:
             return False
@@ -0,0 +1,105 @@
+from typing import Dict, List
+from uuid import UUID
+from sqlalchemy import desc, func
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from src.application.interfaces.repositories.notification_repository import NotificationRepository
+from src.infrastructure.database.models.notification_model import NotificationModel
+from src.domain.exceptions.domain_exceptions import ValidationException
+
+
+class NotificationRepositoryImpl(NotificationRepository):
+    """SQLAlchemy implementation of NotificationRepository"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def create(self, notification: Dict) -> Dict:
+        """Create a new notification"""
+        try:
+            notification_model = NotificationModel.from_dict(notification)
+            self.session.add(notification_model)
+            self.session.commit()
+
+            return notification_model.to_dict()
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            raise ValidationException(
+                f"Failed to create notification: {str(e)}")
+
+    def create_many(self, notifications: List[Dict]) -> int:
+        """Create several notifications in one batch, returns count"""
+        if not notifications:
+            return 0
+
+        try:
+            # Single executemany INSERT instead of one round-trip per row
+            self.session.bulk_insert_mappings(
+                NotificationModel,
+                [NotificationModel.mapping_from_dict(n) for n in notifications]
+            )
+            self.session.commit()
+
+            return len(notifications)
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            raise ValidationException(
+                f"Failed to create notifications: {str(e)}")
+
+    def get_by_user(self, user_id: UUID, limit: int = 20, offset: int = 0) -> List[Dict]:
+        """Get notifications for a user (newest first) with pagination"""
+        notification_models = (
+            self.session.query(NotificationModel)
+            .filter(NotificationModel.user_id == str(user_id))
+            .order_by(desc(NotificationModel.created_at))
+            .limit(limit)
+            .offset(offset)
+            .all()
+        )
+
+        return [model.to_dict() for model in notification_models]
+
+    def mark_as_read(self, notification_id: UUID) -> bool:
+        """Mark a notification as read"""
+        notification_model = self.session.get(
+            NotificationModel, str(notification_id))
+
+        if not notification_model:
+            return False
+
+        try:
+            notification_model.is_read = True
+            self.session.commit()
+            return True
+        except SQLAlchemyError:
+            self.session.rollback()
+            return False
+
+    def mark_all_as_read(self, user_id: UUID) -> int:
+        """Mark all notifications as read for a user, returns count"""
+        try:
+            count = (
+                self.session.query(NotificationModel)
+                .filter(
+                    NotificationModel.user_id == str(user_id),
+                    NotificationModel.is_read.is_(False)
+                )
+                .update({NotificationModel.is_read: True}, synchronize_session=False)
+            )
+            self.session.commit()
+            return count
+        except SQLAlchemyError:
+            self.session.rollback()
+            return 0
+
+    def count_unread(self, user_id: UUID) -> int:
+        """Get count of unread notifications for a user"""
+        return (
+            self.session.query(func.count(NotificationModel.id))
+            .filter(
+                NotificationModel.user_id == str(user_id),
+                NotificationModel.is_read.is_(False)
+            )
+            .scalar()
+        ) or 0
@@ -34,8 +34,7 @@ class ThesisRepositoryImpl(ThesisRepository):
 
     def get_by_id(self, thesis_id: UUID) -> Optional[Thesis]:
         """Get a thesis by ID"""
-        thesis_model = self.session.query(ThesisModel).filter(
-            ThesisModel.id == str(thesis_id)).first()
+        thesis_model = self.session.get(ThesisModel, str(thesis_id))
 
         if not thesis_model:
             return None
@@ -44,8 +43,7 @@ class ThesisRepositoryImpl(ThesisRepository):
 
     def update(self, thesis: Thesis) -> Thesis:
         """Update a thesis"""
-        thesis_model = self.session.query(ThesisModel).filter(
-            ThesisModel.id == str(thesis.id)).first()
+        thesis_model = self.session.get(ThesisModel, str(thesis.id))
 
         if not thesis_model:
             raise EntityNotFoundException("Thesis", thesis.id)
@@ -79,8 +77,7 @@ class ThesisRepositoryImpl(ThesisRepository):
 
     def delete(self, thesis_id: UUID) -> bool:
         """Delete a thesis"""
-        thesis_model = self.session.query(ThesisModel).filter(
-            ThesisModel.id == str(thesis_id)).first()
+        thesis_model = self.session.get(ThesisModel, str(thesis_id))
 
         if not thesis_model:
             return False
@@ -177,8 +174,7 @@ class ThesisRepositoryImpl(ThesisRepository):
     def get_versions(self, thesis_id: UUID) -> List[Thesis]:
         """Get all versions of a thesis"""
         # Get the original thesis to find its title and student
-        original_thesis = self.session.query(ThesisModel).filter(
-            ThesisModel.id == str(thesis_id)).first()
+        original_thesis = self.session.get(ThesisModel, str(thesis_id))
 
         if not original_thesis:
             return []
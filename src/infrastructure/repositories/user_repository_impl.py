@@ -1,5 +1,6 @@
 from typing import List, Optional
 from uuid import UUID
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -9,6 +10,13 @@ from src.domain.value_objects.status import UserRole
 from src.infrastructure.database.models.user_model import UserModel
 from src.domain.exceptions.domain_exceptions import EntityNotFoundException, ValidationException
 
+# Stored role value for advisors, resolved once
+_ADVISOR_VALUE = UserRole.ADVISOR.value
+
+# Plain column select for list reads, rows are turned into entities without
+# building ORM instances first
+_USER_COLUMNS = select(*UserModel.__table__.columns)
+
 
 class UserRepositoryImpl(UserRepository):
     """SQLAlchemy implementation of UserRepository"""
@@ -21,20 +29,38 @@ class UserRepositoryImpl(UserRepository):
         try:
             user_model = UserModel.from_entity(user)
             self.session.add(user_model)
-            self.session.commit()
 
-            # Refresh to get any database-generated values
-            self.session.refresh(user_model)
+            # All columns are populated client-side, so read the entity back
+            # after the flush instead of re-selecting the row after commit
+            self.session.flush()
+            created_user = user_model.to_entity()
+            self.session.commit()
 
-            return user_model.to_entity()
+            return created_user
         except SQLAlchemyError as e:
             self.session.rollback()
             raise ValidationException(f"Failed to create user: {str(e)}")
 
+    def create_many(self, users: List[User]) -> List[User]:
+        """Create several users in one batch"""
+        if not users:
+            return []
+
+        try:
+            # IDs are generated by the application, so no defaults need to be
+            # fetched back and the rows can go out as a single executemany INSERT
+            self.session.bulk_save_objects(
+                [UserModel.from_entity(user) for user in users])
+            self.session.commit()
+
+            return list(users)
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            raise ValidationException(f"Failed to create users: {str(e)}")
+
     def get_by_id(self, user_id: UUID) -> Optional[User]:
         """Get a user by ID"""
-        user_model = self.session.query(UserModel).filter(
-            UserModel.id == str(user_id)).first()
+        user_model = self.session.get(UserModel, str(user_id))
 
         if not user_model:
             return None
@@ -63,8 +89,7 @@ class UserRepositoryImpl(UserRepository):
 
     def update(self, user: User) -> User:
         """Update a user"""
-        user_model = self.session.query(UserModel).filter(
-            UserModel.id == str(user.id)).first()
+        user_model = self.session.get(UserModel, str(user.id))
 
         if not user_model:
             raise EntityNotFoundException("User", user.id)
@@ -85,18 +110,19 @@ class UserRepositoryImpl(UserRepository):
             if user.password_hash and user.password_hash != user_model.password_hash:
                 user_model.password_hash = user.password_hash
 
+            # Flushing applies the updated_at onupdate default locally
+            self.session.flush()
+            updated_user = user_model.to_entity()
             self.session.commit()
-            self.session.refresh(user_model)
 
-            return user_model.to_entity()
+            return updated_user
         except SQLAlchemyError as e:
             self.session.rollback()
             raise ValidationException(f"Failed to update user: {str(e)}")
 
     def delete(self, user_id: UUID) -> bool:
         """Delete a user"""
-        user_model = self.session.query(UserModel).filter(
-            UserModel.id == str(user_id)).first()
+        user_model = self.session.get(UserModel, str(user_id))
 
         if not user_model:
             return False
@@ -111,25 +137,29 @@ class UserRepositoryImpl(UserRepository):
 
     def get_all(self, limit: int = 100, offset: int = 0) -> List[User]:
         """Get all users with pagination"""
-        user_models = self.session.query(
-            UserModel).limit(limit).offset(offset).all()
+        rows = self.session.execute(
+            _USER_COLUMNS.limit(limit).offset(offset)).all()
 
-        return [model.to_entity() for model in user_models]
+        return [User.from_row(row) for row in rows]
 
     def get_by_role(self, role: UserRole, limit: int = 100, offset: int = 0) -> List[User]:
         """Get users by role with pagination"""
-        user_models = self.session.query(UserModel).filter(
-            UserModel.role == role.value
-        ).limit(limit).offset(offset).all()
+        rows = self.session.execute(
+            _USER_COLUMNS.where(
+                UserModel.role == role.value
+            ).limit(limit).offset(offset)
+        ).all()
 
-        return [model.to_entity() for model in user_models]
+        return [User.from_row(row) for row in rows]
 
     def get_advisors_by_department(self, department: str) -> List[User]:
         """Get all advisors in a department"""
-        user_models = self.session.query(UserModel).filter(
-            UserModel.role == UserRole.ADVISOR.value,
-            UserModel.department == department,
-            UserModel.is_active == True
+        rows = self.session.execute(
+            _USER_COLUMNS.where(
+                UserModel.role == _ADVISOR_VALUE,
+                UserModel.department == department,
+                UserModel.is_active.is_(True)
+            )
         ).all()
 
-        return [model.to_entity() for model in user_models]
+        return [User.from_row(row) for row in rows]
@@ -1,16 +1,45 @@
 import os
+import re
 import uuid
 import cloudinary
 import cloudinary.uploader
-import cloudinary.api
+import cloudinary.utils
 from typing import Dict, BinaryIO, Optional, Tuple, List
 from uuid import UUID
 import io
 import mimetypes
+import shutil
+import requests
 
 from src.application.interfaces.services.storage_service import StorageService
 from src.domain.exceptions.domain_exceptions import FileStorageException
 
+# Shared HTTP session so downloads reuse pooled keep-alive connections
+_http_session = requests.Session()
+
+# Chunk size used when streaming downloads (1MB)
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Cloudinary delivery URL: .../<cloud>/<resource_type>/upload/[v<version>/]<public_id>
+_CLD_URL_RE = re.compile(
+    r"^https?://res\.cloudinary\.com/[^/]+/(?P<rtype>\w+)/upload/(?:v\d+/)?(?P<pid>.+)$")
+
+
+def _parse_cloudinary_url(file_path: str) -> Optional[Tuple[str, str]]:
+    """Extract (resource_type, public_id) from a Cloudinary delivery URL"""
+    match = _CLD_URL_RE.match(file_path)
+    if not match:
+        return None
+
+    return match.group("rtype"), match.group("pid")
+
+
+def _resolve_download_url(public_id: str, resource_type: str = "raw") -> str:
+    """Build the delivery URL of a resource locally, without an Admin API call"""
+    url, _ = cloudinary.utils.cloudinary_url(
+        public_id, resource_type=resource_type, secure=True)
+    return url
+
 
 class CloudinaryStorageService(StorageService):
     """Cloudinary implementation of the storage service"""
@@ -44,17 +73,14 @@ class CloudinaryStorageService(StorageService):
             Dict containing file info like path, size, type, etc.
         """
         # First validate the file
-        is_valid, error_message = self.validate_file(file_data, file_name)
+        # (validation also measures the file size, so reuse it)
+        is_valid, error_message, file_size = self.validate_file(
+            file_data, file_name)
         if not is_valid:
             raise FileStorageException(error_message)
 
-        # Get file size
-        file_data.seek(0, 2)  # Go to end of file
-        file_size = file_data.tell()  # Get position (size)
-        file_data.seek(0)  # Go back to beginning
-
         # Get file extension and type
-        file_ext = file_name.split(".")[-1].lower() if "." in file_name else ""
+        file_ext = self._extract_ext(file_name)
         file_type = self.ALLOWED_FILE_TYPES.get(
             file_ext, "application/octet-stream")
 
@@ -89,51 +115,40 @@ class CloudinaryStorageService(StorageService):
     def get_file(self, file_path: str) -> Optional[BinaryIO]:
         """Get a file from Cloudinary"""
         try:
-            # Extract public_id from the URL
-            if "cloudinary.com" not in file_path:
+            # Extract resource type and public_id from the URL
+            parsed = _parse_cloudinary_url(file_path)
+            if not parsed:
                 return None
 
-            # Get the last part of the URL
-            parts = file_path.split("/")
-            public_id = parts[-1]
+            resource_type, public_id = parsed
 
-            # Download the file
-            response = cloudinary.api.resource(public_id, resource_type="raw")
+            # Resolve the download URL
+            download_url = _resolve_download_url(public_id, resource_type)
 
-            if response and "secure_url" in response:
-                # Create a file-like object
-                file_data = io.BytesIO()
+            # Create a file-like object
+            file_data = io.BytesIO()
 
-                # Fetch the file content from secure_url
-                import requests
-                file_content = requests.get(response["secure_url"]).content
-                file_data.write(file_content)
-                file_data.seek(0)
+            # Stream the file content from the download URL in chunks
+            with _http_session.get(download_url, stream=True) as download:
+                download.raise_for_status()
+                download.raw.decode_content = True
+                shutil.copyfileobj(download.raw, file_data, DOWNLOAD_CHUNK_SIZE)
 
-                return file_data
+            file_data.seek(0)
 
-            return None
+            return file_data
         except Exception:
             return None
 
     def delete_file(self, file_path: str) -> bool:
         """Delete a file from Cloudinary"""
         try:
-            # Extract public_id from the URL
-            if "cloudinary.com" not in file_path:
+            # Extract resource type and public_id (without version number) from the URL
+            parsed = _parse_cloudinary_url(file_path)
+            if not parsed:
                 return False
 
-            # Get the public ID
-            parts = file_path.split("/")
-            resource_type = "raw"  # Default to raw for documents
-
-            # Extract public_id without version number
-            url_parts = file_path.split("/")
-            if "upload" in url_parts:
-                upload_index = url_parts.index("upload")
-                public_id = "/".join(url_parts[upload_index + 2:])
-            else:
-                public_id = parts[-1]
+            resource_type, public_id = parsed
 
             # Delete the file
             result = cloudinary.uploader.destroy(
@@ -149,22 +164,22 @@ class CloudinaryStorageService(StorageService):
         # In a production environment, you might want to generate a signed URL with expiration
         return file_path
 
-    def validate_file(self, file_data: BinaryIO, file_name: str) -> Tuple[bool, str]:
+    def validate_file(self, file_data: BinaryIO, file_name: str) -> Tuple[bool, str, int]:
         """
         Validate a file (type, size, content, etc.)
         
         Returns:
-            Tuple of (is_valid, error_message)
+            Tuple of (is_valid, error_message, file_size); file_size is 0
+            when validation fails before the size is measured
         """
         # Check file extension
-        if "." not in file_name:
-            return False, "File must have an extension"
-
-        file_ext = file_name.split(".")[-1].lower()
+        file_ext = self._extract_ext(file_name)
+        if not file_ext:
+            return False, "File must have an extension", 0
 
         if file_ext not in self.ALLOWED_FILE_TYPES:
             allowed_exts = ", ".join(self.ALLOWED_FILE_TYPES.keys())
-            return False, f"File type not allowed. Allowed types: {allowed_exts}"
+            return False, f"File type not allowed. Allowed types: {allowed_exts}", 0
 
         # Check file size
         file_data.seek(0, 2)  # Go to end of file
@@ -173,9 +188,15 @@ class CloudinaryStorageService(StorageService):
 
         if file_size > self.MAX_FILE_SIZE:
             max_size_mb = self.MAX_FILE_SIZE / (1024 * 1024)
-            return False, f"File too large. Maximum size: {max_size_mb}MB"
+            return False, f"File too large. Maximum size: {max_size_mb}MB", file_size
 
         # Additional security checks could be added here
         # For example, checking the actual content type using python-magic
 
-        return True, ""
+        return True, "", file_size
+
+    @staticmethod
+    def _extract_ext(file_name: str) -> str:
+        """Get the lowercased extension of a file name, or an empty string"""
+        _, dot, ext = file_name.rpartition(".")
+        return ext.lower() if dot else ""
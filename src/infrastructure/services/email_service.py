@@ -5,27 +5,114 @@ from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from src.application.interfaces.services.notification_service import NotificationService
 from src.application.interfaces.repositories.user_repository import UserRepository
 from src.application.interfaces.repositories.thesis_repository import ThesisRepository
 from src.application.interfaces.repositories.feedback_repository import FeedbackRepository
+from src.application.interfaces.repositories.notification_repository import NotificationRepository
 from src.domain.value_objects.status import NotificationType, UserRole
 
 
 class EmailNotificationService(NotificationService):
     """Email implementation of the notification service"""
 
+    # Email templates per notification type: (subject, body, placeholder defaults)
+    _TEMPLATES = {
+        NotificationType.NEW_SUBMISSION: (
+            "New Thesis Submission: {thesis_title}",
+            "A new thesis has been submitted by {student_name}.\n\n"
+            "Thesis: {thesis_title}\n"
+            "Submitted: {submitted_at}\n\n"
+            "Please login to the Thesis Management System to review this submission.",
+            {"thesis_title": "Untitled", "student_name": "a student",
+             "submitted_at": "recently"}
+        ),
+        NotificationType.EMAIL_VERIFICATION: (
+            "Verify Your Email - Draft Deck",
+            "Hello {name},\n\n"
+            "Thank you for registering with Draft Deck. To verify your email address, please use the following verification code:\n\n"
+            "Verification Code: {verification_code}\n\n"
+            "This code will expire in 24 hours.\n\n"
+            "If you did not register for an account, please ignore this email.\n\n"
+            "Best regards,\nThe Draft Deck Team",
+            {"name": "User", "verification_code": ""}
+        ),
+        NotificationType.PASSWORD_RESET: (
+            "Password Reset Request - Draft Deck",
+            "Hello {name},\n\n"
+            "We received a request to reset your password. To proceed with the password reset, please use the following verification code:\n\n"
+            "Reset Code: {reset_code}\n\n"
+            "This code will expire in 24 hours.\n\n"
+            "If you did not request a password reset, please ignore this email.\n\n"
+            "Best regards,\nThe Draft Deck Team",
+            {"name": "User", "reset_code": ""}
+        ),
+        NotificationType.FEEDBACK_PROVIDED: (
+            "Feedback Provided on Thesis: {thesis_title}",
+            "Feedback has been provided by {advisor_name}.\n\n"
+            "Thesis: {thesis_title}\n"
+            "Feedback Date: {feedback_date}\n\n"
+            "Please login to the Thesis Management System to view the feedback.",
+            {"thesis_title": "Untitled", "advisor_name": "your advisor",
+             "feedback_date": "recently"}
+        ),
+        NotificationType.REVISION_REQUESTED: (
+            "Revision Requested for Thesis: {thesis_title}",
+            "Your thesis status has been updated from {old_status} "
+            "to {new_status}.\n\n"
+            "Thesis: {thesis_title}\n"
+            "Updated: {updated_at}\n\n"
+            "Please login to the Thesis Management System to view feedback and make necessary revisions.",
+            {"thesis_title": "Untitled", "old_status": "previous status",
+             "new_status": "Needs Revision", "updated_at": "recently"}
+        ),
+        NotificationType.THESIS_APPROVED: (
+            "Thesis Approved: {thesis_title}",
+            "Congratulations! Your thesis has been approved.\n\n"
+            "Thesis: {thesis_title}\n"
+            "Updated: {updated_at}\n\n"
+            "Please login to the Thesis Management System for more details.",
+            {"thesis_title": "Untitled", "updated_at": "recently"}
+        ),
+        NotificationType.THESIS_REJECTED: (
+            "Thesis Status Update: {thesis_title}",
+            "Your thesis status has been updated from {old_status} "
+            "to {new_status}.\n\n"
+            "Thesis: {thesis_title}\n"
+            "Updated: {updated_at}\n\n"
+            "Please login to the Thesis Management System to view feedback and learn about next steps.",
+            {"thesis_title": "Untitled", "old_status": "previous status",
+             "new_status": "Rejected", "updated_at": "recently"}
+        ),
+        NotificationType.REVIEW_COMPLETE: (
+            "Thesis Review Complete: {thesis_title}",
+            "Your thesis review has been completed and the status has been updated to {new_status}.\n\n"
+            "Thesis: {thesis_title}\n"
+            "Updated: {updated_at}\n\n"
+            "Please login to the Thesis Management System for more details.",
+            {"thesis_title": "Untitled", "new_status": "updated status",
+             "updated_at": "recently"}
+        ),
+    }
+
+    _DEFAULT_EMAIL_CONTENT = (
+        "Thesis Management System Notification",
+        "You have a new notification in the Thesis Management System. Please login to view it."
+    )
+
     def __init__(
         self,
         user_repository: UserRepository,
         thesis_repository: ThesisRepository = None,
-        feedback_repository: FeedbackRepository = None
+        feedback_repository: FeedbackRepository = None,
+        notification_repository: NotificationRepository = None
     ):
         self.user_repository = user_repository
         self.thesis_repository = thesis_repository
         self.feedback_repository = feedback_repository
+        self.notification_repository = notification_repository
 
         # Email configuration
         self.smtp_server = os.getenv("MAIL_SERVER", "smtp.gmail.com")
@@ -36,9 +123,6 @@ class EmailNotificationService(NotificationService):
             "MAIL_DEFAULT_SENDER", self.smtp_username)
         self.use_tls = os.getenv("MAIL_USE_TLS", "True").lower() in [
             "true", "1", "yes"]
-        # In-memory notification storage (for demo)
-        # In production, use a database table
-        self.notifications = []
 
     def send_email(self, recipient_email: str, subject: str, body: str,
                    html_body: Optional[str] = None, attachments: Optional[List[Dict]] = None) -> bool:
@@ -47,10 +131,69 @@ class EmailNotificationService(NotificationService):
             # Log that email sending is disabled
             return False
 
+        msg = self._build_message(subject, body, html_body, attachments)
+        msg["To"] = recipient_email
+
+        try:
+            # Connect to SMTP server and send email
+            server = self._connect()
+            server.sendmail(self.default_sender,
+                            recipient_email, msg.as_string())
+            server.close()
+
+            return True
+        except Exception as e:
+            # Log the error
+            print(f"Failed to send email: {str(e)}")
+            return False
+
+    def send_bulk(self, recipient_emails: List[str], subject: str, body: str,
+                  html_body: Optional[str] = None) -> bool:
+        """Send the same email to several recipients over one SMTP connection"""
+        if not recipient_emails:
+            return True
+
+        if not self.smtp_username or not self.smtp_password:
+            # Log that email sending is disabled
+            return False
+
+        # Build the message once, only the recipient changes per send
+        msg = self._build_message(subject, body, html_body)
+        server = None
+        all_sent = True
+
+        try:
+            for recipient_email in recipient_emails:
+                del msg["To"]
+                msg["To"] = recipient_email
+
+                # A failure for one recipient must not stop the others
+                try:
+                    if server is None:
+                        server = self._connect()
+                    server.sendmail(self.default_sender,
+                                    recipient_email, msg.as_string())
+                except smtplib.SMTPServerDisconnected as e:
+                    # Reconnect for the next recipient
+                    print(f"Failed to send email to {recipient_email}: {str(e)}")
+                    server = None
+                    all_sent = False
+                except Exception as e:
+                    # Log the error
+                    print(f"Failed to send email to {recipient_email}: {str(e)}")
+                    all_sent = False
+        finally:
+            if server is not None:
+                server.close()
+
+        return all_sent
+
+    def _build_message(self, subject: str, body: str, html_body: Optional[str] = None,
+                       attachments: Optional[List[Dict]] = None) -> MIMEMultipart:
+        """Build an email message without a recipient"""
         msg = MIMEMultipart("alternative")
         msg["Subject"] = subject
         msg["From"] = self.default_sender
-        msg["To"] = recipient_email
 
         # Attach plain text body
         msg.attach(MIMEText(body, "plain"))
@@ -71,26 +214,19 @@ class EmailNotificationService(NotificationService):
                                     f"attachment; filename={file_name}")
                     msg.attach(part)
 
-        try:
-            # Connect to SMTP server
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.ehlo()
+        return msg
 
-            if self.use_tls:
-                server.starttls()
-                server.ehlo()
+    def _connect(self) -> smtplib.SMTP:
+        """Open an authenticated connection to the SMTP server"""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        server.ehlo()
 
-            # Login and send email
-            server.login(self.smtp_username, self.smtp_password)
-            server.sendmail(self.default_sender,
-                            recipient_email, msg.as_string())
-            server.close()
+        if self.use_tls:
+            server.starttls()
+            server.ehlo()
 
-            return True
-        except Exception as e:
-            # Log the error
-            print(f"Failed to send email: {str(e)}")
-            return False
+        server.login(self.smtp_username, self.smtp_password)
+        return server
 
     def send_notification(self, user_id: UUID, notification_type: NotificationType,
                           data: Dict[str, Any], send_email: bool = True) -> bool:
@@ -100,19 +236,14 @@ class EmailNotificationService(NotificationService):
         if not user:
             return False
 
-        # Create notification record
-        notification = {
-            # Simple ID generation
-            "id": UUID(int=len(self.notifications) + 1),
-            "user_id": user_id,
-            "type": notification_type.value,
-            "data": data,
-            "is_read": False,
-            "created_at": datetime.utcnow()
-        }
-
-        # Store notification
-        self.notifications.append(notification)
+        # Create and store notification record, best-effort like the email below
+        if self.notification_repository:
+            try:
+                self.notification_repository.create(
+                    self._build_notification(user_id, notification_type, data))
+            except Exception as e:
+                # Log the error
+                print(f"Failed to store notification: {str(e)}")
 
         # Send email if requested
         if send_email:
@@ -130,47 +261,31 @@ class EmailNotificationService(NotificationService):
 
     def get_user_notifications(self, user_id: UUID, limit: int = 20, offset: int = 0) -> List[Dict]:
         """Get notifications for a user"""
-        user_notifications = [
-            n for n in self.notifications
-            if n["user_id"] == user_id
-        ]
-
-        # Sort by created_at (newest first)
-        sorted_notifications = sorted(
-            user_notifications,
-            key=lambda n: n["created_at"],
-            reverse=True
-        )
+        if not self.notification_repository:
+            return []
 
-        # Apply pagination
-        return sorted_notifications[offset:offset + limit]
+        return self.notification_repository.get_by_user(user_id, limit, offset)
 
     def mark_notification_as_read(self, notification_id: UUID) -> bool:
         """Mark a notification as read"""
-        for notification in self.notifications:
-            if notification["id"] == notification_id:
-                notification["is_read"] = True
-                return True
+        if not self.notification_repository:
+            return False
 
-        return False
+        return self.notification_repository.mark_as_read(notification_id)
 
     def mark_all_as_read(self, user_id: UUID) -> int:
         """Mark all notifications as read for a user, returns count"""
-        count = 0
-
-        for notification in self.notifications:
-            if notification["user_id"] == user_id and not notification["is_read"]:
-                notification["is_read"] = True
-                count += 1
+        if not self.notification_repository:
+            return 0
 
-        return count
+        return self.notification_repository.mark_all_as_read(user_id)
 
     def get_unread_count(self, user_id: UUID) -> int:
         """Get count of unread notifications for a user"""
-        return len([
-            n for n in self.notifications
-            if n["user_id"] == user_id and not n["is_read"]
-        ])
+        if not self.notification_repository:
+            return 0
+
+        return self.notification_repository.count_unread(user_id)
 
     def notify_new_thesis_submission(self, thesis_id: UUID) -> bool:
         """Notify advisors about a new thesis submission"""
@@ -208,22 +323,36 @@ class EmailNotificationService(NotificationService):
             # Notify all advisors (in a real app, only notify advisors in the same department)
             advisors = self.user_repository.get_by_role(UserRole.ADVISOR)
 
-            success = True
-            for advisor in advisors:
-                result = self.send_notification(
-                    user_id=advisor.id,
-                    notification_type=NotificationType.NEW_SUBMISSION,
-                    data={
-                        "thesis_id": str(thesis.id),
-                        "thesis_title": thesis.title,
-                        "student_name": f"{student.first_name} {student.last_name}",
-                        "student_id": str(student.id),
-                        "submitted_at": thesis.submitted_at.isoformat() if thesis.submitted_at else None
-                    }
-                )
-                success = success and result
+            data = {
+                "thesis_id": str(thesis.id),
+                "thesis_title": thesis.title,
+                "student_name": f"{student.first_name} {student.last_name}",
+                "student_id": str(student.id),
+                "submitted_at": thesis.submitted_at.isoformat() if thesis.submitted_at else None
+            }
 
-            return success
+            # Store all advisor notifications in a single batch insert
+            if self.notification_repository:
+                try:
+                    self.notification_repository.create_many([
+                        self._build_notification(
+                            advisor.id, NotificationType.NEW_SUBMISSION, data)
+                        for advisor in advisors
+                    ])
+                except Exception as e:
+                    # Log the error
+                    print(f"Failed to store notifications: {str(e)}")
+
+            subject, body = self._get_notification_email_content(
+                NotificationType.NEW_SUBMISSION, data)
+
+            self.send_bulk(
+                recipient_emails=[advisor.email for advisor in advisors],
+                subject=subject,
+                body=body
+            )
+
+            return True
 
         return False
 
@@ -317,85 +446,27 @@ class EmailNotificationService(NotificationService):
 
         return student_notification and advisor_notification
 
+    def _build_notification(self, user_id: UUID, notification_type: NotificationType,
+                            data: Dict[str, Any]) -> Dict:
+        """Create a notification record"""
+        return {
+            "id": uuid4(),
+            "user_id": user_id,
+            "type": notification_type.value,
+            "data": data,
+            "is_read": False,
+            "created_at": datetime.utcnow()
+        }
+
     def _get_notification_email_content(self, notification_type: NotificationType, data: Dict[str, Any]) -> Optional[Tuple[str, str]]:
         """Get email subject and body for a notification type"""
-        if notification_type == NotificationType.NEW_SUBMISSION:
-            subject = f"New Thesis Submission: {data.get('thesis_title', 'Untitled')}"
-            body = f"A new thesis has been submitted by {data.get('student_name', 'a student')}.\n\n"
-            body += f"Thesis: {data.get('thesis_title', 'Untitled')}\n"
-            body += f"Submitted: {data.get('submitted_at', 'recently')}\n\n"
-            body += "Please login to the Thesis Management System to review this submission."
-
-            return subject, body
-
-        elif notification_type == NotificationType.EMAIL_VERIFICATION:
-            subject = "Verify Your Email - Draft Deck"
-            body = f"Hello {data.get('name', 'User')},\n\n"
-            body += "Thank you for registering with Draft Deck. To verify your email address, please use the following verification code:\n\n"
-            body += f"Verification Code: {data.get('verification_code', '')}\n\n"
-            body += "This code will expire in 24 hours.\n\n"
-            body += "If you did not register for an account, please ignore this email.\n\n"
-            body += "Best regards,\nThe Draft Deck Team"
-            
-            return subject, body
-
-        elif notification_type == NotificationType.PASSWORD_RESET:
-            subject = "Password Reset Request - Draft Deck"
-            body = f"Hello {data.get('name', 'User')},\n\n"
-            body += "We received a request to reset your password. To proceed with the password reset, please use the following verification code:\n\n"
-            body += f"Reset Code: {data.get('reset_code', '')}\n\n"
-            body += "This code will expire in 24 hours.\n\n"
-            body += "If you did not request a password reset, please ignore this email.\n\n"
-            body += "Best regards,\nThe Draft Deck Team"
-            
-            return subject, body
-
-        elif notification_type == NotificationType.FEEDBACK_PROVIDED:
-            subject = f"Feedback Provided on Thesis: {data.get('thesis_title', 'Untitled')}"
-            body = f"Feedback has been provided by {data.get('advisor_name', 'your advisor')}.\n\n"
-            body += f"Thesis: {data.get('thesis_title', 'Untitled')}\n"
-            body += f"Feedback Date: {data.get('feedback_date', 'recently')}\n\n"
-            body += "Please login to the Thesis Management System to view the feedback."
-
-            return subject, body
-
-        elif notification_type == NotificationType.REVISION_REQUESTED:
-            subject = f"Revision Requested for Thesis: {data.get('thesis_title', 'Untitled')}"
-            body = f"Your thesis status has been updated from {data.get('old_status', 'previous status')} "
-            body += f"to {data.get('new_status', 'Needs Revision')}.\n\n"
-            body += f"Thesis: {data.get('thesis_title', 'Untitled')}\n"
-            body += f"Updated: {data.get('updated_at', 'recently')}\n\n"
-            body += "Please login to the Thesis Management System to view feedback and make necessary revisions."
-
-            return subject, body
-
-        elif notification_type == NotificationType.THESIS_APPROVED:
-            subject = f"Thesis Approved: {data.get('thesis_title', 'Untitled')}"
-            body = "Congratulations! Your thesis has been approved.\n\n"
-            body += f"Thesis: {data.get('thesis_title', 'Untitled')}\n"
-            body += f"Updated: {data.get('updated_at', 'recently')}\n\n"
-            body += "Please login to the Thesis Management System for more details."
-
-            return subject, body
-
-        elif notification_type == NotificationType.THESIS_REJECTED:
-            subject = f"Thesis Status Update: {data.get('thesis_title', 'Untitled')}"
-            body = f"Your thesis status has been updated from {data.get('old_status', 'previous status')} "
-            body += f"to {data.get('new_status', 'Rejected')}.\n\n"
-            body += f"Thesis: {data.get('thesis_title', 'Untitled')}\n"
-            body += f"Updated: {data.get('updated_at', 'recently')}\n\n"
-            body += "Please login to the Thesis Management System to view feedback and learn about next steps."
-
-            return subject, body
-
-        elif notification_type == NotificationType.REVIEW_COMPLETE:
-            subject = f"Thesis Review Complete: {data.get('thesis_title', 'Untitled')}"
-            body = f"Your thesis review has been completed and the status has been updated to {data.get('new_status', 'updated status')}.\n\n"
-            body += f"Thesis: {data.get('thesis_title', 'Untitled')}\n"
-            body += f"Updated: {data.get('updated_at', 'recently')}\n\n"
-            body += "Please login to the Thesis Management System for more details."
-
-            return subject, body
+        template = self._TEMPLATES.get(notification_type)
 
         # Default/unknown notification type
-        return ("Thesis Management System Notification", "You have a new notification in the Thesis Management System. Please login to view it.")
+        if template is None:
+            return self._DEFAULT_EMAIL_CONTENT
+
+        subject_fmt, body_fmt, defaults = template
+        values = {**defaults, **data}
+
+        return subject_fmt.format_map(values), body_fmt.format_map(values)
@@ -1,8 +1,11 @@
 import os
 import jwt
-import random
-import string
-from datetime import datetime, timedelta
+import secrets
+import time
+import hashlib
+import redis
+import threading
+from datetime import timedelta
 from typing import Dict, Optional, Tuple
 from uuid import UUID
 import json
@@ -11,6 +14,27 @@ from src.application.interfaces.services.auth_service import AuthService
 from src.application.interfaces.repositories.user_repository import UserRepository
 from src.domain.entities.user import User
 
+# Revoked tokens are kept in-process (L1) and in Redis (L2) when configured.
+# With Redis the L1 holds at most REVOKED_CACHE_SIZE entries. Without it the
+# L1 is the only record, so unexpired entries are never evicted and the size
+# only schedules purges of expired ones
+REVOKED_CACHE_SIZE = 10000
+REVOKED_KEY_PREFIX = "jwt:bl:"
+# Tokens Redis reported as not revoked skip the EXISTS round trip for a few
+# seconds. A revocation made by another worker can take that long to apply here
+NOT_REVOKED_CACHE_SIZE = 10000
+NOT_REVOKED_CACHE_TTL = 5  # seconds
+# Keep an unreachable Redis from stalling every token check
+REDIS_SOCKET_TIMEOUT = 0.5  # seconds
+
+# Password hashing is CPU bound and bcrypt releases the GIL on the calling
+# thread, so hashes run inline and this caps how many run at once per process
+_HASH_SLOTS = threading.BoundedSemaphore(os.cpu_count() or 1)
+
+# Decoded claims are reused for repeat verifications of the same token
+TOKEN_CACHE_SIZE = 10000
+TOKEN_CACHE_TTL = 300  # seconds
+
 
 class JwtService(AuthService):
     """JWT implementation of the authentication service"""
@@ -20,20 +44,39 @@ class JwtService(AuthService):
         self.password_hash_service = password_hash_service
         self.secret_key = os.getenv(
             "JWT_SECRET_KEY", "default-secret-key-change-me")
+        # Encoded once instead of on every encode/decode. For RS256, load the
+        # key object once here (e.g. load_pem_private_key) rather than PEM text
+        self._secret_bytes = self.secret_key.encode("utf-8")
         self.access_token_expires = int(
             os.getenv("JWT_ACCESS_TOKEN_EXPIRES", 14400))  # 4 hour
         self.refresh_token_expires = int(
             os.getenv("JWT_REFRESH_TOKEN_EXPIRES", 2592000))  # 30 days
         self.algorithm = "HS256"
-        self.blacklisted_tokens = set()  # In production, use Redis or database
+        # Token hash -> exp timestamp, entries are dropped once the token expires
+        self._revoked: Dict[str, int] = {}
+        self._revoked_purge_at = REVOKED_CACHE_SIZE
+        # Token hash -> timestamp until which Redis need not be asked again
+        self._not_revoked: Dict[str, float] = {}
+        redis_url = os.getenv("REDIS_URL")
+        self._redis = redis.Redis.from_url(
+            redis_url,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+        ) if redis_url else None
+        # Token hash -> (claims, cache expiry timestamp)
+        self._verified: Dict[str, Tuple[Dict, float]] = {}
+        # Request threads share the caches above; writes and evictions hold this lock
+        self._cache_lock = threading.Lock()
 
     def hash_password(self, password: str) -> str:
         """Hash a password using passlib"""
-        return self.password_hash_service.hash(password)
+        with _HASH_SLOTS:
+            return self.password_hash_service.hash(password)
 
     def verify_password(self, password: str, password_hash: str) -> bool:
         """Verify a password against its hash"""
-        return self.password_hash_service.verify(password, password_hash)
+        with _HASH_SLOTS:
+            return self.password_hash_service.verify(password, password_hash)
 
     def create_access_token(self, user_id: UUID, additional_claims: Optional[Dict] = None) -> str:
         """Create a JWT access token"""
@@ -55,37 +98,44 @@ class JwtService(AuthService):
     def _create_token(self, user_id: UUID, token_type: str, expires_delta: timedelta,
                       additional_claims: Optional[Dict] = None) -> str:
         """Helper to create JWT tokens"""
-        now = datetime.utcnow()
+        now = int(time.time())
 
         payload = {
             "sub": str(user_id),
             "type": token_type,
             "iat": now,
-            "exp": now + expires_delta
+            "exp": now + int(expires_delta.total_seconds())
         }
 
         if additional_claims:
             payload.update(additional_claims)
 
-        return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        return jwt.encode(payload, self._secret_bytes, algorithm=self.algorithm)
 
     def verify_token(self, token: str) -> Tuple[bool, Dict]:
         """Verify a JWT token and return claims if valid"""
-        try:
-            if token in self.blacklisted_tokens:
-                return False, {"error": "Token has been revoked"}
+        key = self._token_key(token)
+        cached = self._verified.get(key)
 
-            payload = jwt.decode(token, self.secret_key,
-                                 algorithms=[self.algorithm])
+        if cached and cached[1] > time.time():
+            payload = cached[0]
+        else:
+            try:
+                # jwt.decode also rejects expired tokens, and ones without exp
+                payload = jwt.decode(token, self._secret_bytes,
+                                     algorithms=[self.algorithm],
+                                     options={"require": ["exp"]})
+            except jwt.PyJWTError as e:
+                return False, {"error": str(e)}
 
-            # Check expiration
-            if datetime.utcnow() > datetime.fromtimestamp(payload["exp"]):
-                return False, {"error": "Token has expired"}
+            self._cache_claims(key, payload)
 
-            return True, payload
+        # Checked on cache hits too, so revocations apply immediately
+        if self._is_revoked(key, payload["exp"]):
+            return False, {"error": "Token has been revoked"}
 
-        except jwt.PyJWTError as e:
-            return False, {"error": str(e)}
+        # A copy, so callers cannot change the cached claims
+        return True, dict(payload)
 
     def get_user_from_token(self, token: str) -> Optional[User]:
         """Get user from a token"""
@@ -130,10 +180,91 @@ class JwtService(AuthService):
         if not is_valid:
             return False
 
-        # Add to blacklist
-        self.blacklisted_tokens.add(token)
+        # Add to blacklist, Redis expires the entry together with the token
+        key = self._token_key(token)
+        with self._cache_lock:
+            self._verified.pop(key, None)
+            self._not_revoked.pop(key, None)
+        self._remember_revoked(key, payload["exp"])
+
+        if self._redis:
+            try:
+                self._redis.set(REVOKED_KEY_PREFIX + key, "1", exat=payload["exp"])
+            except redis.RedisError:
+                # Fall back to the in-process blacklist
+                pass
+
         return True
 
+    @staticmethod
+    def _token_key(token: str) -> str:
+        """Hash a token for use as a blacklist key"""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def _cache_claims(self, key: str, payload: Dict):
+        """Cache decoded claims until the token expires or the TTL runs out"""
+        now = time.time()
+
+        with self._cache_lock:
+            if len(self._verified) >= TOKEN_CACHE_SIZE:
+                self._verified = {k: v for k, v in self._verified.items() if v[1] > now}
+
+                if len(self._verified) >= TOKEN_CACHE_SIZE:
+                    del self._verified[next(iter(self._verified))]
+
+            self._verified[key] = (payload, min(payload["exp"], now + TOKEN_CACHE_TTL))
+
+    def _is_revoked(self, key: str, exp: int) -> bool:
+        """Check the in-process blacklist, then Redis"""
+        if key in self._revoked:
+            return True
+
+        if not self._redis:
+            return False
+
+        now = time.time()
+        if self._not_revoked.get(key, 0) > now:
+            return False
+
+        try:
+            revoked = self._redis.exists(REVOKED_KEY_PREFIX + key)
+        except redis.RedisError:
+            # Fail open to the in-process blacklist, without caching the miss
+            return False
+
+        if revoked:
+            self._remember_revoked(key, exp)
+        else:
+            with self._cache_lock:
+                if len(self._not_revoked) >= NOT_REVOKED_CACHE_SIZE:
+                    self._not_revoked = {k: t for k, t in self._not_revoked.items() if t > now}
+
+                    if len(self._not_revoked) >= NOT_REVOKED_CACHE_SIZE:
+                        del self._not_revoked[next(iter(self._not_revoked))]
+
+                self._not_revoked[key] = min(exp, now + NOT_REVOKED_CACHE_TTL)
+
+        return bool(revoked)
+
+    def _remember_revoked(self, key: str, exp: int):
+        """Add a token hash to the bounded in-process blacklist"""
+        with self._cache_lock:
+            if len(self._revoked) >= self._revoked_purge_at:
+                # Expired tokens are rejected by jwt.decode anyway
+                now = time.time()
+                self._revoked = {k: e for k, e in self._revoked.items() if e > now}
+
+                if self._redis:
+                    # Redis still holds evicted entries, so the oldest can go
+                    if len(self._revoked) >= REVOKED_CACHE_SIZE:
+                        del self._revoked[next(iter(self._revoked))]
+                else:
+                    # Dropping a live entry would un-revoke its token, so grow
+                    # instead and purge again once the list has doubled
+                    self._revoked_purge_at = max(REVOKED_CACHE_SIZE, 2 * len(self._revoked))
+
+            self._revoked[key] = exp
+
     def generate_password_reset_token(self, user_email: str) -> Optional[str]:
         """Generate a password reset code and store in user record"""
         user = self.user_repository.get_by_email(user_email)
@@ -154,7 +285,7 @@ class JwtService(AuthService):
         
     def _generate_reset_code(self, length: int = 5) -> str:
         """Generate a random numeric reset code"""
-        return ''.join(random.choices(string.digits, k=length))
+        return f"{secrets.randbelow(10 ** length):0{length}d}"
 
     def verify_password_reset_token(self, email: str, reset_code: str) -> bool:
         """Verify a password reset code for the specified email"""
@@ -163,5 +294,5 @@ class JwtService(AuthService):
         if not user:
             return False
 
-        # Verify the reset code
+        # Verify the reset code (the entity compares it in constant time)
         return user.verify_password_reset_code(reset_code)
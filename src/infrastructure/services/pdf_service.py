@@ -1,10 +1,11 @@
-import io
-import os
-from typing import BinaryIO, List
+import shutil
+from functools import lru_cache
+from typing import BinaryIO, List, Tuple
 
 import tempfile
+from xml.sax.saxutils import escape
 
-from PyPDF2 import PdfReader, PdfWriter
+from PyPDF2 import PdfMerger, PdfReader, PdfWriter
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
@@ -15,6 +16,50 @@ from src.domain.entities.thesis import Thesis
 from src.domain.entities.user import User
 from src.application.interfaces.services.storage_service import StorageService
 
+# Generated PDFs stay in memory up to this size, then spill to disk
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+# Chunk size used when copying uploaded PDFs
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Style for the report metadata table
+METADATA_TABLE_STYLE = TableStyle([
+    ('INNERGRID', (0, 0), (-1, -1), 0.25, colors.black),
+    ('BOX', (0, 0), (-1, -1), 0.5, colors.black),
+    ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('PADDING', (0, 0), (-1, -1), 6)
+])
+
+
+@lru_cache(maxsize=1)
+def _get_styles() -> Tuple[ParagraphStyle, ...]:
+    """Build the report paragraph styles once per process"""
+    styles = getSampleStyleSheet()
+
+    # Create custom styles
+    info_style = ParagraphStyle(
+        "InfoStyle",
+        parent=styles["Normal"],
+        fontSize=10,
+        leading=12,
+        leftIndent=20
+    )
+
+    comment_style = ParagraphStyle(
+        "CommentStyle",
+        parent=styles["Normal"],
+        fontSize=10,
+        leading=12,
+        leftIndent=20,
+        borderWidth=1,
+        borderColor=colors.gray,
+        borderPadding=5,
+        backColor=colors.lightgrey
+    )
+
+    return styles["Title"], styles["Heading1"], styles["Normal"], info_style, comment_style
+
 
 class PdfService:
     """Service for PDF generation and manipulation"""
@@ -46,7 +91,7 @@ class PdfService:
             File-like object containing the PDF
         """
         # Create a buffer for the PDF
-        buffer = io.BytesIO()
+        buffer = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
 
         # Create PDF document
         doc = SimpleDocTemplate(
@@ -57,31 +102,7 @@ class PdfService:
         )
 
         # Get styles
-        styles = getSampleStyleSheet()
-        title_style = styles["Title"]
-        heading_style = styles["Heading1"]
-        normal_style = styles["Normal"]
-
-        # Create custom styles
-        info_style = ParagraphStyle(
-            "InfoStyle",
-            parent=styles["Normal"],
-            fontSize=10,
-            leading=12,
-            leftIndent=20
-        )
-
-        comment_style = ParagraphStyle(
-            "CommentStyle",
-            parent=styles["Normal"],
-            fontSize=10,
-            leading=12,
-            leftIndent=20,
-            borderWidth=1,
-            borderColor=colors.gray,
-            borderPadding=5,
-            backColor=colors.lightgrey
-        )
+        title_style, heading_style, normal_style, info_style, comment_style = _get_styles()
 
         # List to hold flowable elements
         elements = []
@@ -105,13 +126,7 @@ class PdfService:
         ]
 
         metadata_table = Table(metadata, colWidths=[120, 350])
-        metadata_table.setStyle(TableStyle([
-            ('INNERGRID', (0, 0), (-1, -1), 0.25, colors.black),
-            ('BOX', (0, 0), (-1, -1), 0.5, colors.black),
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('PADDING', (0, 0), (-1, -1), 6)
-        ]))
+        metadata_table.setStyle(METADATA_TABLE_STYLE)
 
         elements.append(metadata_table)
         elements.append(Spacer(1, 20))
@@ -126,12 +141,12 @@ class PdfService:
             elements.append(Spacer(1, 6))
 
         elements.append(Paragraph("Comments:", normal_style))
-        elements.append(Paragraph(feedback.overall_comments, info_style))
+        elements.append(Paragraph(escape(feedback.overall_comments), info_style))
         elements.append(Spacer(1, 12))
 
         if feedback.recommendations:
             elements.append(Paragraph("Recommendations:", normal_style))
-            elements.append(Paragraph(feedback.recommendations, info_style))
+            elements.append(Paragraph(escape(feedback.recommendations), info_style))
             elements.append(Spacer(1, 12))
 
         # Add inline comments if requested
@@ -145,6 +160,7 @@ class PdfService:
                 key=lambda c: (c.page or 0, c.position_y or 0)
             )
 
+            comment_flowables = []
             for comment in sorted_comments:
                 location = ""
                 if comment.page:
@@ -152,23 +168,27 @@ class PdfService:
                     if comment.position_x and comment.position_y:
                         location += f" (x:{comment.position_x:.2f}, y:{comment.position_y:.2f})"
 
-                comment_header = f"Comment {location}"
-                elements.append(Paragraph(comment_header, normal_style))
-                elements.append(Paragraph(comment.content, comment_style))
-                elements.append(Spacer(1, 10))
+                # Comment text is user input, escape it so reportlab's markup
+                # parser does not choke on "<" or "&"
+                comment_flowables.extend([
+                    Paragraph(f"Comment {location}", normal_style),
+                    Paragraph(escape(comment.content), comment_style),
+                    Spacer(1, 10)
+                ])
+
+            elements.extend(comment_flowables)
 
         # Build PDF
         doc.build(elements)
 
-        # If including original document and it exists, merge with feedback report
-        if include_original_document and thesis.file_path:
+        # If including original document and it is a PDF, merge with feedback report
+        # (checked before fetching so non-PDF originals are never downloaded)
+        if (include_original_document and thesis.file_path
+                and thesis.file_type == "application/pdf"):
             # Get original document
             original_file = self.storage_service.get_file(thesis.file_path)
 
-            if original_file and thesis.file_type == "application/pdf":
-                # Create a new buffer for the merged PDF
-                merged_buffer = io.BytesIO()
-
+            if original_file:
                 # Reset the buffer position
                 buffer.seek(0)
 
@@ -182,25 +202,16 @@ class PdfService:
 
     def _merge_pdfs(self, feedback_pdf: BinaryIO, original_pdf: BinaryIO) -> BinaryIO:
         """Merge feedback PDF with original PDF"""
-        output_buffer = io.BytesIO()
-
-        # Create PDF readers
-        feedback_reader = PdfReader(feedback_pdf)
-        original_reader = PdfReader(original_pdf)
-
-        # Create PDF writer
-        writer = PdfWriter()
+        output_buffer = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
 
-        # Add feedback pages
-        for page_num in range(len(feedback_reader.pages)):
-            writer.add_page(feedback_reader.pages[page_num])
-
-        # Add original document pages
-        for page_num in range(len(original_reader.pages)):
-            writer.add_page(original_reader.pages[page_num])
+        # Append both documents as a whole instead of copying page by page
+        merger = PdfMerger()
+        merger.append(feedback_pdf)
+        merger.append(original_pdf)
 
         # Write merged PDF to buffer
-        writer.write(output_buffer)
+        merger.write(output_buffer)
+        merger.close()
         output_buffer.seek(0)
 
         return output_buffer
@@ -220,14 +231,14 @@ class PdfService:
         Returns:
             File-like object containing the annotated PDF
         """
-        # Create temporary files for the PDF operations
-        with tempfile.NamedTemporaryFile(delete=False) as temp_original:
-            temp_original.write(original_pdf.read())
-            temp_original_path = temp_original.name
+        # Copy the original to an anonymous temporary file, which is removed
+        # as soon as it is closed (or the process dies)
+        with tempfile.TemporaryFile() as temp_original:
+            shutil.copyfileobj(original_pdf, temp_original, COPY_CHUNK_SIZE)
+            temp_original.seek(0)
 
-        try:
             # Create PDF reader for original file
-            reader = PdfReader(temp_original_path)
+            reader = PdfReader(temp_original)
             writer = PdfWriter()
 
             # Copy all pages from original to writer
@@ -255,14 +266,9 @@ class PdfService:
                         # This is a simplified placeholder
                         pass
 
-            # Write to output buffer
-            output_buffer = io.BytesIO()
+            # Write to output buffer while the reader's stream is still open
+            output_buffer = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
             writer.write(output_buffer)
             output_buffer.seek(0)
 
             return output_buffer
-
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_original_path):
-                os.unlink(temp_original_path)
@@ -1,33 +1,56 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 from uuid import uuid4
 from datetime import datetime
 
 from src.app import create_app
+from src.domain.entities.feedback import Feedback, FeedbackComment
+from src.domain.entities.thesis import Thesis
+from src.domain.entities.user import User
 from src.domain.value_objects.status import UserRole, ThesisStatus
+from src.infrastructure.repositories.feedback_repository_impl import FeedbackRepositoryImpl
+from src.infrastructure.repositories.thesis_repository_impl import ThesisRepositoryImpl
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from src.infrastructure.services.cloudinary_service import CloudinaryStorageService
+from src.infrastructure.services.email_service import EmailNotificationService
+from src.infrastructure.services.jwt_service import JwtService
+from src.infrastructure.services.pdf_service import PdfService
 
+INVALID_TOKEN = (False, {"error": "Invalid token"})
 
-@pytest.fixture
-def app():
-    """Create and return a Flask app for testing"""
-    app = create_app(testing=True)
-    return app
+# Fixed timestamp for mock entities, nothing asserts on wall-clock time
+_NOW = datetime(2024, 1, 1)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def app(mock_repositories, mock_services):
+    """Create the Flask app once per session (per xdist worker), wired to the session mocks"""
+    mocks = {
+        'user_repository': mock_repositories['user_repo'],
+        'thesis_repository': mock_repositories['thesis_repo'],
+        'feedback_repository': mock_repositories['feedback_repo'],
+        'jwt_service': mock_services['jwt_service'],
+        'storage_service': mock_services['storage_service'],
+        'pdf_service': mock_services['pdf_service'],
+        'notification_service': mock_services['email_service'],
+    }
+    return create_app(testing=True, mocks=mocks)
+
+
+@pytest.fixture(scope="session")
 def client(app):
     """Create and return a test client for the app"""
     return app.test_client()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app_context(app):
     """Push an application context for the tests"""
     with app.app_context():
         yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ids():
     """Generate and return UUIDs for testing"""
     return {
@@ -40,7 +63,7 @@ def mock_ids():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_users(mock_ids):
     """Create mock user objects for testing"""
     mock_student = _create_mock_user(
@@ -74,7 +97,7 @@ def mock_users(mock_ids):
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_thesis(mock_ids):
     """Create a mock thesis object for testing"""
     return _create_mock_thesis(
@@ -84,7 +107,7 @@ def mock_thesis(mock_ids):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_feedback(mock_ids):
     """Create a mock feedback object for testing"""
     return _create_mock_feedback(
@@ -94,121 +117,112 @@ def mock_feedback(mock_ids):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_repositories(mock_users, mock_thesis, mock_feedback, mock_ids):
     """Set up mock repositories for testing"""
-    with patch('src.infrastructure.repositories.user_repository_impl.UserRepositoryImpl') as mock_user_repo, \
-         patch('src.infrastructure.repositories.thesis_repository_impl.ThesisRepositoryImpl') as mock_thesis_repo, \
-         patch('src.infrastructure.repositories.feedback_repository_impl.FeedbackRepositoryImpl') as mock_feedback_repo:
-        
-        # Configure user repository
-        instance = mock_user_repo.return_value
-        instance.get_by_email.side_effect = lambda email: next(
-            (user for user in mock_users.values() if user.email == email), None
-        )
-        instance.get_by_id.side_effect = lambda user_id: next(
-            (user for user in mock_users.values() if str(user.id) == str(user_id)), None
-        )
-        instance.get_all.return_value = list(mock_users.values())
-        instance.get_by_role.side_effect = lambda role, limit, offset: [
-            user for user in mock_users.values() if user.role == role
-        ]
-        instance.create.return_value = mock_users['student']
-        
-        # Configure thesis repository
-        instance = mock_thesis_repo.return_value
-        instance.get_by_id.return_value = mock_thesis
-        instance.get_all.return_value = [mock_thesis]
-        instance.get_by_student.return_value = [mock_thesis]
-        instance.get_by_advisor.return_value = [mock_thesis]
-        instance.get_stats.return_value = {"draft": 1, "submitted": 2, "approved": 1, "rejected": 0}
-        instance.create.return_value = mock_thesis
-        instance.update.return_value = mock_thesis
-        
-        # Configure feedback repository
-        instance = mock_feedback_repo.return_value
-        instance.get_by_id.return_value = mock_feedback
-        instance.get_by_thesis.return_value = [mock_feedback]
-        instance.create.return_value = mock_feedback
-        instance.update.return_value = mock_feedback
-        
-        yield {
-            'user_repo': mock_user_repo,
-            'thesis_repo': mock_thesis_repo,
-            'feedback_repo': mock_feedback_repo
-        }
-
-
-@pytest.fixture
-def mock_services(mock_users, mock_ids):
+    mock_user_repo = MagicMock(spec=UserRepositoryImpl)
+    mock_thesis_repo = MagicMock(spec=ThesisRepositoryImpl)
+    mock_feedback_repo = MagicMock(spec=FeedbackRepositoryImpl)
+
+    # Index users once so lookups are plain dict gets
+    users_by_email = {user.email: user for user in mock_users.values()}
+    # Keyed by both UUID and str so lookups never format the id
+    users_by_id = {key: user for user in mock_users.values() for key in (user.id, str(user.id))}
+    users_by_role = {}
+    for user in mock_users.values():
+        users_by_role.setdefault(user.role, []).append(user)
+
+    # Configure user repository
+    mock_user_repo.get_by_email.side_effect = users_by_email.get
+    mock_user_repo.get_by_id.side_effect = users_by_id.get
+    mock_user_repo.get_all.return_value = list(mock_users.values())
+    mock_user_repo.get_by_role.side_effect = lambda role, limit, offset: (
+        users_by_role.get(role, [])[offset:offset + limit]
+    )
+    mock_user_repo.create.return_value = mock_users['student']
+    
+    # Configure thesis repository
+    mock_thesis_repo.get_by_id.return_value = mock_thesis
+    mock_thesis_repo.get_all.return_value = [mock_thesis]
+    mock_thesis_repo.get_by_student.return_value = [mock_thesis]
+    mock_thesis_repo.get_by_advisor.return_value = [mock_thesis]
+    mock_thesis_repo.get_stats.return_value = {"draft": 1, "submitted": 2, "approved": 1, "rejected": 0}
+    mock_thesis_repo.create.return_value = mock_thesis
+    mock_thesis_repo.update.return_value = mock_thesis
+    
+    # Configure feedback repository
+    mock_feedback_repo.get_by_id.return_value = mock_feedback
+    mock_feedback_repo.get_by_thesis.return_value = [mock_feedback]
+    mock_feedback_repo.create.return_value = mock_feedback
+    mock_feedback_repo.update.return_value = mock_feedback
+    
+    return {
+        'user_repo': mock_user_repo,
+        'thesis_repo': mock_thesis_repo,
+        'feedback_repo': mock_feedback_repo
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_services(mock_repositories, mock_users, mock_ids):
     """Set up mock services for testing"""
-    with patch('src.infrastructure.services.jwt_service.JwtService') as mock_jwt_service, \
-         patch('src.infrastructure.services.cloudinary_service.CloudinaryStorageService') as mock_storage_service, \
-         patch('src.infrastructure.services.pdf_service.PdfService') as mock_pdf_service, \
-         patch('src.infrastructure.services.email_service.EmailNotificationService') as mock_email_service:
-        
-        # Configure JWT service
-        instance = mock_jwt_service.return_value
-        instance.generate_tokens.return_value = {
-            "access_token": "fake_access_token", 
-            "refresh_token": "fake_refresh_token", 
-            "token_type": "bearer", 
-            "expires_in": 3600
-        }
-        instance.verify_token.side_effect = lambda token: (
-            (True, {"sub": str(mock_ids['student_id']), "type": "access"}) 
-            if token == "student_token" or token == "Bearer student_token"
-            else (True, {"sub": str(mock_ids['advisor_id']), "type": "access"}) 
-            if token == "advisor_token" or token == "Bearer advisor_token"
-            else (True, {"sub": str(mock_ids['admin_id']), "type": "access"}) 
-            if token == "admin_token" or token == "Bearer admin_token" 
-            else (True, {"sub": str(mock_ids['student_id']), "type": "refresh"}) 
-            if token == "fake_refresh_token" or token == "Bearer fake_refresh_token"
-            else (False, {"error": "Invalid token"})
-        )
-        
-        instance.get_user_from_token.side_effect = lambda token: (
-            mock_users['student'] 
-            if token == "student_token" or (token.startswith("Bearer ") and token.split(" ")[1] == "student_token")
-            else mock_users['advisor'] 
-            if token == "advisor_token" or (token.startswith("Bearer ") and token.split(" ")[1] == "advisor_token")
-            else mock_users['admin'] 
-            if token == "admin_token" or (token.startswith("Bearer ") and token.split(" ")[1] == "admin_token")
-            else None
-        )
-        
-        instance.refresh_access_token.return_value = "new_fake_access_token"
-        instance.authenticate.return_value = (
-            mock_users['student'], 
-            "fake_access_token", 
-            "fake_refresh_token", 
-            "bearer", 
-            3600
-        )
-        instance.verify_password_reset_token.return_value = True
-        instance.reset_password.return_value = True
-        
-        # Configure Storage service
-        instance = mock_storage_service.return_value
-        instance.get_file.return_value = (b'test file content', 'test-thesis.pdf')
-        instance.store_file.return_value = "test-thesis.pdf"
-        
-        # Configure PDF service
-        instance = mock_pdf_service.return_value
-        instance.generate_feedback_pdf.return_value = (b'test pdf content', 'feedback.pdf')
-        
-        yield {
-            'jwt_service': mock_jwt_service,
-            'storage_service': mock_storage_service,
-            'pdf_service': mock_pdf_service,
-            'email_service': mock_email_service
-        }
+    mock_jwt_service = MagicMock(spec=JwtService)
+    # Set in JwtService.__init__, so the class spec does not provide it
+    mock_jwt_service.user_repository = mock_repositories['user_repo']
+    mock_storage_service = MagicMock(spec=CloudinaryStorageService)
+    mock_pdf_service = MagicMock(spec=PdfService)
+    mock_email_service = MagicMock(spec=EmailNotificationService)
+
+    # Configure JWT service
+    # Token -> result tables, "Bearer " prefixes are stripped before lookup
+    verify_table = {
+        "student_token": (True, {"sub": str(mock_ids['student_id']), "type": "access"}),
+        "advisor_token": (True, {"sub": str(mock_ids['advisor_id']), "type": "access"}),
+        "admin_token": (True, {"sub": str(mock_ids['admin_id']), "type": "access"}),
+        "fake_refresh_token": (True, {"sub": str(mock_ids['student_id']), "type": "refresh"}),
+    }
+    user_table = {
+        "student_token": mock_users['student'],
+        "advisor_token": mock_users['advisor'],
+        "admin_token": mock_users['admin'],
+    }
+
+    mock_jwt_service.verify_token.side_effect = lambda token: verify_table.get(
+        token.removeprefix("Bearer "), INVALID_TOKEN
+    )
+    mock_jwt_service.get_user_from_token.side_effect = lambda token: user_table.get(
+        token.removeprefix("Bearer ")
+    )
+    
+    mock_jwt_service.refresh_access_token.return_value = "new_fake_access_token"
+    mock_jwt_service.verify_password_reset_token.return_value = True
+    
+    # Configure Storage service
+    mock_storage_service.get_file.return_value = (b'test file content', 'test-thesis.pdf')
+    
+    return {
+        'jwt_service': mock_jwt_service,
+        'storage_service': mock_storage_service,
+        'pdf_service': mock_pdf_service,
+        'email_service': mock_email_service
+    }
+
+
+@pytest.fixture(autouse=True)
+def reset_session_mocks(request):
+    """Clear call records on the session mocks a test used, keeping their configuration"""
+    yield
+
+    for name in ('mock_repositories', 'mock_services'):
+        if name in request.fixturenames:
+            for mock in request.getfixturevalue(name).values():
+                mock.reset_mock()
 
 
 # Helper functions
 def _create_mock_user(user_id, email, first_name, last_name, role, is_active=True, email_verified=True):
     """Create a mock user object"""
-    user = MagicMock()
+    user = MagicMock(spec=User)
     user.id = user_id
     user.email = email
     user.first_name = first_name
@@ -218,14 +232,14 @@ def _create_mock_user(user_id, email, first_name, last_name, role, is_active=Tru
     user.email_verified = email_verified
     user.department = "Computer Science" if role == UserRole.STUDENT or role == UserRole.ADVISOR else None
     user.student_id = "12345" if role == UserRole.STUDENT else None
-    user.created_at = datetime.now()
-    user.updated_at = datetime.now()
+    user.created_at = _NOW
+    user.updated_at = _NOW
     return user
 
 
 def _create_mock_thesis(thesis_id, student_id, advisor_id=None, status=ThesisStatus.DRAFT):
     """Create a mock thesis object"""
-    thesis = MagicMock()
+    thesis = MagicMock(spec=Thesis)
     thesis.id = thesis_id
     thesis.title = "Test Thesis"
     thesis.thesis_type = MagicMock()
@@ -240,25 +254,25 @@ def _create_mock_thesis(thesis_id, student_id, advisor_id=None, status=ThesisSta
     thesis.file_type = "application/pdf" if status != ThesisStatus.DRAFT else None
     thesis.version = 1
     thesis.metadata = {"keywords": ["test", "api"]}
-    thesis.created_at = datetime.now()
-    thesis.updated_at = datetime.now()
-    thesis.submitted_at = datetime.now() if status != ThesisStatus.DRAFT else None
-    thesis.approved_at = datetime.now() if status == ThesisStatus.APPROVED else None
+    thesis.created_at = _NOW
+    thesis.updated_at = _NOW
+    thesis.submitted_at = _NOW if status != ThesisStatus.DRAFT else None
+    thesis.approved_at = _NOW if status == ThesisStatus.APPROVED else None
     thesis.rejected_at = None
     return thesis
 
 
 def _create_mock_feedback(feedback_id, thesis_id, advisor_id):
     """Create a mock feedback object"""
-    comment = MagicMock()
+    comment = MagicMock(spec=FeedbackComment)
     comment.id = uuid4()
     comment.content = "This is a comment"
     comment.page = 1
     comment.position_x = 100
     comment.position_y = 100
-    comment.created_at = datetime.now()
+    comment.created_at = _NOW
 
-    feedback = MagicMock()
+    feedback = MagicMock(spec=Feedback)
     feedback.id = feedback_id
     feedback.thesis_id = thesis_id
     feedback.advisor_id = advisor_id
@@ -266,6 +280,6 @@ def _create_mock_feedback(feedback_id, thesis_id, advisor_id):
     feedback.rating = 4
     feedback.recommendations = "These are my recommendations"
     feedback.comments = [comment]
-    feedback.created_at = datetime.now()
-    feedback.updated_at = datetime.now()
+    feedback.created_at = _NOW
+    feedback.updated_at = _NOW
     return feedback 
\ No newline at end of file
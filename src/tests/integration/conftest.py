@@ -0,0 +1,133 @@
+import pytest
+from unittest.mock import MagicMock
+
+from src.app import create_app
+from src.tests.integration.fixtures import (
+    IDS, INVALID_TOKEN, MOCK_STUDENT, MOCK_ADVISOR, MOCK_ADMIN, MOCK_THESIS, MOCK_FEEDBACK,
+    PDF_BYTES, THESIS_BYTES
+)
+
+
+# create_app dependencies replaced with shared mocks
+MOCKED_DEPENDENCIES = (
+    'jwt_service',
+    'user_repository',
+    'thesis_repository',
+    'feedback_repository',
+    'storage_service',
+    'pdf_service',
+    'notification_service',
+)
+
+
+@pytest.fixture(scope="session")
+def api_mocks():
+    """Create the service and repository mocks shared by the test session"""
+    return {name: MagicMock() for name in MOCKED_DEPENDENCIES}
+
+
+@pytest.fixture(scope="session")
+def api_client(api_mocks):
+    """Create the app once per session, wired to the mocks via TESTING_MOCKS"""
+    app = create_app(testing=True, mocks=api_mocks)
+
+    # The context is popped when the session finishes
+    with app.app_context():
+        yield app.test_client()
+
+
+@pytest.fixture
+def endpoint_client(api_client, api_mocks):
+    """Return the session test client, clearing recorded mock calls after each test"""
+    yield api_client
+
+    # reset_mock keeps return values and side effects
+    for mock in api_mocks.values():
+        mock.reset_mock()
+
+
+@pytest.fixture(scope="session")
+def auth_mocks(api_mocks):
+    """Configure the JWT service and user repository mocks every route relies on"""
+    users = (MOCK_STUDENT, MOCK_ADVISOR, MOCK_ADMIN)
+    users_by_email = {user.email: user for user in users}
+    users_by_email["newstudent@example.com"] = MOCK_STUDENT
+    # Keyed by both UUID and str so lookups never format the id
+    users_by_id = {key: user for user in users for key in (user.id, str(user.id))}
+    users_by_role = {user.role: [user] for user in users}
+    users_by_student_id = {MOCK_STUDENT.student_id: MOCK_STUDENT}
+
+    # Tokens are matched with or without the Bearer prefix
+    verify_table = {
+        "student_token": (True, {"sub": str(IDS.student_id), "type": "access"}),
+        "advisor_token": (True, {"sub": str(IDS.advisor_id), "type": "access"}),
+        "admin_token": (True, {"sub": str(IDS.admin_id), "type": "access"}),
+        "fake_refresh_token": (True, {"sub": str(IDS.student_id), "type": "refresh"}),
+    }
+    user_table = {
+        "student_token": MOCK_STUDENT,
+        "advisor_token": MOCK_ADVISOR,
+        "admin_token": MOCK_ADMIN,
+    }
+
+    # Configure JWT service mock
+    mock_jwt_service = api_mocks['jwt_service']
+    mock_jwt_service.verify_token.side_effect = lambda token: verify_table.get(
+        token.removeprefix("Bearer "), INVALID_TOKEN
+    )
+    mock_jwt_service.refresh_access_token.return_value = "new_fake_access_token"
+    mock_jwt_service.get_user_from_token.side_effect = lambda token: user_table.get(
+        token.removeprefix("Bearer ")
+    )
+    mock_jwt_service.hash_password.return_value = "hashed_password"
+    mock_jwt_service.verify_password.return_value = True
+    mock_jwt_service.create_access_token.return_value = "fake_access_token"
+    mock_jwt_service.create_refresh_token.return_value = "fake_refresh_token"
+    mock_jwt_service.generate_password_reset_token.return_value = "123456"
+    mock_jwt_service.verify_password_reset_token.return_value = True
+    mock_jwt_service.reset_password.return_value = True
+
+    # Configure user repository mock
+    mock_user_repo = api_mocks['user_repository']
+    mock_user_repo.get_by_email.side_effect = users_by_email.get
+    mock_user_repo.get_by_id.side_effect = users_by_id.get
+    mock_user_repo.get_all.return_value = list(users)
+    mock_user_repo.get_by_role.side_effect = lambda role, limit, offset: users_by_role.get(role, [])
+    mock_user_repo.get_by_student_id.side_effect = users_by_student_id.get
+    mock_user_repo.create.return_value = MOCK_STUDENT
+    mock_user_repo.verify_email.return_value = True
+    mock_user_repo.update.return_value = MOCK_STUDENT
+
+    return api_mocks
+
+
+@pytest.fixture(scope="session")
+def thesis_mocks(auth_mocks):
+    """Configure the thesis repository and storage service mocks"""
+    mock_thesis_repo = auth_mocks['thesis_repository']
+    mock_thesis_repo.get_by_id.return_value = MOCK_THESIS
+    mock_thesis_repo.get_all.return_value = [MOCK_THESIS]
+    mock_thesis_repo.get_by_student.return_value = [MOCK_THESIS]
+    mock_thesis_repo.get_by_advisor.return_value = [MOCK_THESIS]
+    mock_thesis_repo.get_stats.return_value = {"draft": 1, "submitted": 2, "approved": 1, "rejected": 0}
+    mock_thesis_repo.create.return_value = MOCK_THESIS
+    mock_thesis_repo.update.return_value = MOCK_THESIS
+
+    auth_mocks['storage_service'].get_file.return_value = (THESIS_BYTES, 'test-thesis.pdf')
+    auth_mocks['storage_service'].store_file.return_value = "test-thesis.pdf"
+
+    return auth_mocks
+
+
+@pytest.fixture(scope="session")
+def feedback_mocks(thesis_mocks):
+    """Configure the feedback repository and PDF service mocks"""
+    mock_feedback_repo = thesis_mocks['feedback_repository']
+    mock_feedback_repo.get_by_id.return_value = MOCK_FEEDBACK
+    mock_feedback_repo.get_by_thesis.return_value = [MOCK_FEEDBACK]
+    mock_feedback_repo.create.return_value = MOCK_FEEDBACK
+    mock_feedback_repo.update.return_value = MOCK_FEEDBACK
+
+    thesis_mocks['pdf_service'].generate_feedback_pdf.return_value = (PDF_BYTES, 'feedback.pdf')
+
+    return thesis_mocks
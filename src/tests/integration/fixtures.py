@@ -0,0 +1,233 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+import orjson
+
+from src.domain.value_objects.status import UserRole, ThesisStatus
+
+
+# Fixed timestamp for every entity so responses are deterministic
+NOW = datetime(2024, 1, 1)
+
+
+# Lightweight stand-ins for the domain entities returned by mocked repositories.
+# Mutating methods used by the routes are accepted but, like the MagicMocks they
+# replace, leave the shared test data untouched unless noted.
+
+@dataclass(slots=True)
+class MockUser:
+    """User returned by the mocked user repository"""
+    id: UUID
+    email: str
+    first_name: str
+    last_name: str
+    role: UserRole
+    is_active: bool = True
+    email_verified: bool = True
+    department: Optional[str] = None
+    student_id: Optional[str] = None
+    password_hash: str = "hashed_password"
+    verification_code: Optional[str] = None
+    verification_code_expiry: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    def full_name(self) -> str:
+        return f"{self.first_name} {self.last_name}"
+
+    def verify_email(self, code: str) -> bool:
+        return True
+
+    def set_verification_code(self, code: str, expiry_hours: int = 24):
+        pass
+
+    def activate(self):
+        pass
+
+    def deactivate(self):
+        pass
+
+
+@dataclass(slots=True)
+class MockThesisType:
+    """Thesis type with only the value the routes read"""
+    value: str
+
+
+@dataclass(slots=True)
+class MockThesis:
+    """Thesis returned by the mocked thesis repository"""
+    id: UUID
+    title: str
+    thesis_type: MockThesisType
+    student_id: UUID
+    advisor_id: Optional[UUID] = None
+    description: Optional[str] = None
+    status: ThesisStatus = ThesisStatus.DRAFT
+    file_path: Optional[str] = None
+    file_name: Optional[str] = None
+    file_size: Optional[int] = None
+    file_type: Optional[str] = None
+    version: int = 1
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    submitted_at: Optional[datetime] = None
+    approved_at: Optional[datetime] = None
+    rejected_at: Optional[datetime] = None
+
+    def assign_advisor(self, advisor_id: UUID):
+        """Record the advisor so responses include it"""
+        self.advisor_id = advisor_id
+        self.updated_at = NOW
+
+    def update_status(self, status: ThesisStatus):
+        pass
+
+    def update_file_info(self, *args, **kwargs):
+        pass
+
+    def update_title_description(self, *args, **kwargs):
+        pass
+
+
+@dataclass(slots=True)
+class MockComment:
+    """Inline feedback comment"""
+    id: UUID
+    content: str
+    page: Optional[int] = None
+    position_x: Optional[float] = None
+    position_y: Optional[float] = None
+    created_at: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class MockFeedback:
+    """Feedback returned by the mocked feedback repository"""
+    id: UUID
+    thesis_id: UUID
+    advisor_id: UUID
+    overall_comments: str
+    rating: Optional[int] = None
+    recommendations: Optional[str] = None
+    comments: List[MockComment] = field(default_factory=list)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    def add_comment(self, *args, **kwargs):
+        pass
+
+
+# Helper functions for creating mock data
+def create_mock_user(user_id, email, first_name, last_name, role, is_active=True, email_verified=True):
+    return MockUser(
+        id=user_id,
+        email=email,
+        first_name=first_name,
+        last_name=last_name,
+        role=role,
+        is_active=is_active,
+        email_verified=email_verified,
+        department="Computer Science" if role == UserRole.STUDENT or role == UserRole.ADVISOR else None,
+        student_id="12345" if role == UserRole.STUDENT else None,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def create_mock_thesis(thesis_id, student_id, advisor_id=None, status=ThesisStatus.DRAFT):
+    submitted = status != ThesisStatus.DRAFT
+    return MockThesis(
+        id=thesis_id,
+        title="Test Thesis",
+        thesis_type=MockThesisType("masters"),
+        student_id=student_id,
+        advisor_id=advisor_id,
+        description="This is a test thesis description",
+        status=status,
+        file_path="test-thesis.pdf" if submitted else None,
+        file_name="test-thesis.pdf" if submitted else None,
+        file_size=1024 if submitted else None,
+        file_type="application/pdf" if submitted else None,
+        version=1,
+        metadata={"keywords": ["test", "api"]},
+        created_at=NOW,
+        updated_at=NOW,
+        submitted_at=NOW if submitted else None,
+        approved_at=NOW if status == ThesisStatus.APPROVED else None,
+    )
+
+
+def create_mock_feedback(feedback_id, thesis_id, advisor_id):
+    comment = MockComment(
+        id=IDS.comment_id,
+        content="This is a comment",
+        page=1,
+        position_x=100,
+        position_y=100,
+        created_at=NOW,
+    )
+    return MockFeedback(
+        id=feedback_id,
+        thesis_id=thesis_id,
+        advisor_id=advisor_id,
+        overall_comments="This is overall feedback",
+        rating=4,
+        recommendations="These are my recommendations",
+        comments=[comment],
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+# Shared test data, built once at import time
+IDS = SimpleNamespace(
+    user_id=UUID('00000000-0000-0000-0000-000000000001'),
+    student_id=UUID('00000000-0000-0000-0000-000000000002'),
+    advisor_id=UUID('00000000-0000-0000-0000-000000000003'),
+    admin_id=UUID('00000000-0000-0000-0000-000000000004'),
+    thesis_id=UUID('00000000-0000-0000-0000-000000000005'),
+    feedback_id=UUID('00000000-0000-0000-0000-000000000006'),
+    comment_id=UUID('00000000-0000-0000-0000-000000000007'),
+)
+
+MOCK_STUDENT = create_mock_user(IDS.student_id, "ahmettkadayifci@gmail.com", "John", "Doe", UserRole.STUDENT)
+MOCK_ADVISOR = create_mock_user(IDS.advisor_id, "ahmetkadayfc@hotmail.com", "Jane", "Smith", UserRole.ADVISOR)
+MOCK_ADMIN = create_mock_user(IDS.admin_id, "pewaho2483@cxnlab.com", "Admin", "User", UserRole.ADMIN)
+MOCK_THESIS = create_mock_thesis(IDS.thesis_id, IDS.student_id, IDS.advisor_id)
+MOCK_FEEDBACK = create_mock_feedback(IDS.feedback_id, IDS.thesis_id, IDS.advisor_id)
+
+
+# File payloads returned by the storage and PDF service mocks
+THESIS_BYTES = b'test file content'
+PDF_BYTES = b'test pdf content'
+
+# verify_token result for unknown tokens
+INVALID_TOKEN = (False, {"error": "Invalid token"})
+
+# Authorization header sent for each role
+TOKENS = {
+    'student': 'Bearer student_token',
+    'advisor': 'Bearer advisor_token',
+    'admin': 'Bearer admin_token',
+}
+
+
+def assert_keys(data, *keys):
+    """Assert that every key is present in the response data"""
+    missing = set(keys) - data.keys()
+    assert not missing, f"missing keys: {missing}"
+
+
+def make_request(client, role, method, url, data=None):
+    """Make an authenticated request as the given role, sending data as JSON"""
+    headers = {'Authorization': TOKENS[role]}
+    if data is None:
+        return getattr(client, method)(url, headers=headers)
+    if isinstance(data, dict):
+        data = orjson.dumps(data)
+    return getattr(client, method)(url, data=data, headers=headers, content_type='application/json')
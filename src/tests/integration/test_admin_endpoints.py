@@ -0,0 +1,43 @@
+import orjson
+import pytest
+
+from src.tests.integration.fixtures import IDS, assert_keys, make_request
+
+
+@pytest.fixture
+def client(endpoint_client, thesis_mocks):
+    """Return the shared test client with the admin route mocks configured"""
+    return endpoint_client
+
+
+def test_get_users(client):
+    """Test admin get users endpoint"""
+    response = make_request(client, 'admin', 'get', '/api/admin/users')
+    assert response.status_code == 200
+    response_data = orjson.loads(response.data)
+    assert_keys(response_data, 'users', 'count')
+
+
+_UPDATE_USER_BODY = orjson.dumps({
+    'first_name': 'Updated',
+    'last_name': 'Name',
+    'department': 'Updated Department',
+    'is_active': True,
+    'role': 'student'
+})
+
+
+def test_update_user(client):
+    """Test admin update user endpoint"""
+    response = make_request(client, 'admin', 'put', f'/api/admin/users/{IDS.student_id}', data=_UPDATE_USER_BODY)
+    assert response.status_code == 200
+    response_data = orjson.loads(response.data)
+    assert_keys(response_data, 'message', 'user')
+
+
+def test_get_stats(client):
+    """Test admin stats endpoint"""
+    response = make_request(client, 'admin', 'get', '/api/admin/stats')
+    assert response.status_code == 200
+    response_data = orjson.loads(response.data)
+    assert_keys(response_data, 'users', 'theses')
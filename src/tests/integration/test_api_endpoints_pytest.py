@@ -1,27 +1,7 @@
-import json
+import orjson
 import pytest
 
-
-# Helper functions for making authenticated requests
-def make_student_request(client, method, url, data=None, content_type='application/json'):
-    headers = {'Authorization': 'Bearer student_token'}
-    if data and content_type == 'application/json':
-        data = json.dumps(data)
-    return getattr(client, method)(url, data=data, headers=headers, content_type=content_type)
-
-
-def make_advisor_request(client, method, url, data=None, content_type='application/json'):
-    headers = {'Authorization': 'Bearer advisor_token'}
-    if data and content_type == 'application/json':
-        data = json.dumps(data)
-    return getattr(client, method)(url, data=data, headers=headers, content_type=content_type)
-
-
-def make_admin_request(client, method, url, data=None, content_type='application/json'):
-    headers = {'Authorization': 'Bearer admin_token'}
-    if data and content_type == 'application/json':
-        data = json.dumps(data)
-    return getattr(client, method)(url, data=data, headers=headers, content_type=content_type)
+from src.tests.integration.fixtures import make_request
 
 
 # ------------------- TEST AUTH ROUTES -------------------
@@ -29,7 +9,7 @@ def test_health_check(client):
     """Test the health check endpoint"""
     response = client.get('/')
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = orjson.loads(response.data)
     assert data['status'] == 'ok'
     assert data['message'] == 'Draft Deck API is running'
 
@@ -47,11 +27,9 @@ def test_register(client, mock_repositories):
         'student_id': '12345'
     }
     
-    response = client.post('/api/auth/register', 
-                           data=json.dumps(data), 
-                           content_type='application/json')
+    response = client.post('/api/auth/register', data=orjson.dumps(data), content_type='application/json')
     assert response.status_code == 201
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert 'user' in response_data
     assert 'message' in response_data
 
@@ -64,11 +42,9 @@ def test_login(client, mock_services, mock_users):
         'password': 'password123'
     }
     
-    response = client.post('/api/auth/login', 
-                           data=json.dumps(data), 
-                           content_type='application/json')
+    response = client.post('/api/auth/login', data=orjson.dumps(data), content_type='application/json')
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert 'access_token' in response_data
     assert 'refresh_token' in response_data
     assert 'user' in response_data
@@ -81,16 +57,16 @@ def test_refresh_token(client, mock_services):
     
     response = client.post('/api/auth/refresh', headers=headers)
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert 'access_token' in response_data
     assert response_data['token_type'] == 'bearer'
 
 
 def test_logout(client, mock_services):
     """Test logout endpoint"""
-    response = make_student_request(client, 'post', '/api/auth/logout')
+    response = make_request(client, 'student', 'post', '/api/auth/logout')
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert response_data['message'] == 'Logged out successfully'
 
 
@@ -100,11 +76,9 @@ def test_password_reset_request(client, mock_repositories, mock_services):
         'email': 'student@example.com'
     }
     
-    response = client.post('/api/auth/password-reset/request', 
-                           data=json.dumps(data), 
-                           content_type='application/json')
+    response = client.post('/api/auth/password-reset/request', data=orjson.dumps(data), content_type='application/json')
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert 'message' in response_data
 
 
@@ -115,11 +89,9 @@ def test_password_reset_confirm(client, mock_repositories, mock_services):
         'reset_code': '123456'
     }
     
-    response = client.post('/api/auth/password-reset/confirm', 
-                           data=json.dumps(data), 
-                           content_type='application/json')
+    response = client.post('/api/auth/password-reset/confirm', data=orjson.dumps(data), content_type='application/json')
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert 'message' in response_data
     assert 'valid' in response_data
 
@@ -132,19 +104,17 @@ def test_password_reset_complete(client, mock_repositories, mock_services):
         'new_password': 'NewSecurePassword123!'
     }
     
-    response = client.post('/api/auth/password-reset/complete', 
-                           data=json.dumps(data), 
-                           content_type='application/json')
+    response = client.post('/api/auth/password-reset/complete', data=orjson.dumps(data), content_type='application/json')
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert 'message' in response_data
 
 
 def test_get_current_user(client, mock_services, mock_users):
     """Test get current user endpoint"""
-    response = make_student_request(client, 'get', '/api/auth/me')
+    response = make_request(client, 'student', 'get', '/api/auth/me')
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert 'user' in response_data
 
 
@@ -155,11 +125,9 @@ def test_verify_email(client, mock_repositories):
         'verification_code': '123456'
     }
     
-    response = client.post('/api/auth/verify-email', 
-                           data=json.dumps(data), 
-                           content_type='application/json')
+    response = client.post('/api/auth/verify-email', data=orjson.dumps(data), content_type='application/json')
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert 'message' in response_data
 
 
@@ -169,11 +137,9 @@ def test_resend_verification(client, mock_repositories):
         'email': 'student@example.com'
     }
     
-    response = client.post('/api/auth/resend-verification', 
-                          data=json.dumps(data), 
-                          content_type='application/json')
+    response = client.post('/api/auth/resend-verification', data=orjson.dumps(data), content_type='application/json')
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert 'message' in response_data
 
 
@@ -187,27 +153,27 @@ def test_create_thesis(client, mock_repositories, mock_services, mock_ids):
         'metadata': {'keywords': ['test', 'api']}
     }
     
-    response = make_student_request(client, 'post', '/api/theses', data=data)
+    response = make_request(client, 'student', 'post', '/api/theses', data=data)
     assert response.status_code == 201
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert 'thesis' in response_data
     assert 'message' in response_data
 
 
 def test_get_theses(client, mock_repositories, mock_services):
     """Test get theses endpoint"""
-    response = make_student_request(client, 'get', '/api/theses')
+    response = make_request(client, 'student', 'get', '/api/theses')
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert 'theses' in response_data
     assert 'count' in response_data
 
 
 def test_get_thesis(client, mock_repositories, mock_services, mock_ids):
     """Test get specific thesis endpoint"""
-    response = make_student_request(client, 'get', f'/api/theses/{mock_ids["thesis_id"]}')
+    response = make_request(client, 'student', 'get', f'/api/theses/{mock_ids["thesis_id"]}')
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert str(response_data['id']) == str(mock_ids["thesis_id"])
 
 
@@ -218,9 +184,9 @@ def test_update_thesis(client, mock_repositories, mock_services, mock_ids):
         'description': 'Updated thesis description'
     }
     
-    response = make_student_request(client, 'put', f'/api/theses/{mock_ids["thesis_id"]}', data=data)
+    response = make_request(client, 'student', 'put', f'/api/theses/{mock_ids["thesis_id"]}', data=data)
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert 'message' in response_data
     assert 'thesis' in response_data
 
@@ -232,25 +198,25 @@ def test_update_thesis_status(client, mock_repositories, mock_services, mock_ids
         'comments': 'Submitting thesis for review'
     }
     
-    response = make_student_request(client, 'put', f'/api/theses/{mock_ids["thesis_id"]}/status', data=data)
+    response = make_request(client, 'student', 'put', f'/api/theses/{mock_ids["thesis_id"]}/status', data=data)
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert 'message' in response_data
     assert 'thesis' in response_data
 
 
 def test_download_thesis(client, mock_repositories, mock_services, mock_ids):
     """Test thesis download endpoint"""
-    response = make_student_request(client, 'get', f'/api/theses/{mock_ids["thesis_id"]}/download')
+    response = make_request(client, 'student', 'get', f'/api/theses/{mock_ids["thesis_id"]}/download')
     assert response.status_code == 200
     assert 'application/pdf' in response.headers['Content-Type']
 
 
 def test_assign_advisor(client, mock_repositories, mock_services, mock_ids):
     """Test advisor assignment endpoint"""
-    response = make_advisor_request(client, 'post', f'/api/theses/{mock_ids["thesis_id"]}/assign')
+    response = make_request(client, 'advisor', 'post', f'/api/theses/{mock_ids["thesis_id"]}/assign')
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert 'message' in response_data
     assert 'thesis' in response_data
 
@@ -273,18 +239,18 @@ def test_create_feedback(client, mock_repositories, mock_services, mock_ids):
         ]
     }
     
-    response = make_advisor_request(client, 'post', '/api/feedback', data=data)
+    response = make_request(client, 'advisor', 'post', '/api/feedback', data=data)
     assert response.status_code == 201
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert 'feedback' in response_data
     assert 'message' in response_data
 
 
 def test_get_thesis_feedback(client, mock_repositories, mock_services, mock_ids):
     """Test get thesis feedback endpoint"""
-    response = make_student_request(client, 'get', f'/api/feedback/thesis/{mock_ids["thesis_id"]}')
+    response = make_request(client, 'student', 'get', f'/api/feedback/thesis/{mock_ids["thesis_id"]}')
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert 'feedback' in response_data
     assert 'thesis_id' in response_data
     assert 'thesis_title' in response_data
@@ -292,9 +258,9 @@ def test_get_thesis_feedback(client, mock_repositories, mock_services, mock_ids)
 
 def test_get_feedback(client, mock_repositories, mock_services, mock_ids):
     """Test get specific feedback endpoint"""
-    response = make_student_request(client, 'get', f'/api/feedback/{mock_ids["feedback_id"]}')
+    response = make_request(client, 'student', 'get', f'/api/feedback/{mock_ids["feedback_id"]}')
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert str(response_data['id']) == str(mock_ids["feedback_id"])
 
 
@@ -306,51 +272,39 @@ def test_update_feedback(client, mock_repositories, mock_services, mock_ids):
         'recommendations': 'Updated recommendations'
     }
     
-    response = make_advisor_request(client, 'put', f'/api/feedback/{mock_ids["feedback_id"]}', data=data)
+    response = make_request(client, 'advisor', 'put', f'/api/feedback/{mock_ids["feedback_id"]}', data=data)
     assert response.status_code == 200
-    response_data = json.loads(response.data)
+    response_data = orjson.loads(response.data)
     assert 'message' in response_data
     assert 'feedback' in response_data
 
 
 def test_export_feedback(client, mock_repositories, mock_services, mock_ids):
     """Test feedback export endpoint"""
-    response = make_student_request(client, 'get', f'/api/feedback/{mock_ids["feedback_id"]}/export')
+    response = make_request(client, 'student', 'get', f'/api/feedback/{mock_ids["feedback_id"]}/export')
     assert response.status_code == 200
     assert 'application/pdf' in response.headers['Content-Type']
 
 
 # ------------------- TEST ADMIN ROUTES -------------------
-def test_get_users(client, mock_repositories, mock_services):
-    """Test admin get users endpoint"""
-    response = make_admin_request(client, 'get', '/api/admin/users')
-    assert response.status_code == 200
-    response_data = json.loads(response.data)
-    assert 'users' in response_data
-    assert 'count' in response_data
-
-
-def test_update_user(client, mock_repositories, mock_services, mock_ids):
-    """Test admin update user endpoint"""
-    data = {
-        'first_name': 'Updated',
-        'last_name': 'Name',
-        'department': 'Updated Department',
-        'is_active': True,
-        'role': 'student'
-    }
-    
-    response = make_admin_request(client, 'put', f'/api/admin/users/{mock_ids["student_id"]}', data=data)
-    assert response.status_code == 200
-    response_data = json.loads(response.data)
-    assert 'message' in response_data
-    assert 'user' in response_data
-
-
-def test_get_stats(client, mock_repositories, mock_services):
-    """Test admin stats endpoint"""
-    response = make_admin_request(client, 'get', '/api/admin/stats')
+_UPDATE_USER_DATA = {
+    'first_name': 'Updated',
+    'last_name': 'Name',
+    'department': 'Updated Department',
+    'is_active': True,
+    'role': 'student'
+}
+
+
+@pytest.mark.parametrize('method,url,data,expected_keys', [
+    pytest.param('get', '/api/admin/users', None, ['users', 'count'], id='get_users'),
+    pytest.param('put', '/api/admin/users/{student_id}', _UPDATE_USER_DATA, ['message', 'user'], id='update_user'),
+    pytest.param('get', '/api/admin/stats', None, ['users', 'theses'], id='get_stats'),
+])
+def test_admin_routes(client, mock_repositories, mock_services, mock_ids, method, url, data, expected_keys):
+    """Test admin endpoints respond with the expected keys"""
+    response = make_request(client, 'admin', method, url.format(**mock_ids), data=data)
     assert response.status_code == 200
-    response_data = json.loads(response.data)
-    assert 'users' in response_data
-    assert 'theses' in response_data 
\ No newline at end of file
+    response_data = orjson.loads(response.data)
+    for key in expected_keys:
+        assert key in response_data
@@ -0,0 +1,72 @@
+import orjson
+import pytest
+
+from src.tests.integration.fixtures import IDS, assert_keys, make_request
+
+
+@pytest.fixture
+def client(endpoint_client, feedback_mocks):
+    """Return the shared test client with the feedback route mocks configured"""
+    return endpoint_client
+
+
+_CREATE_FEEDBACK_BODY = orjson.dumps({
+    'thesis_id': str(IDS.thesis_id),
+    'overall_comments': 'This is test feedback',
+    'rating': 4,
+    'recommendations': 'Test recommendations',
+    'comments': [
+        {
+            'content': 'This is a comment',
+            'page': 1,
+            'position_x': 100,
+            'position_y': 100
+        }
+    ]
+})
+
+
+def test_create_feedback(client):
+    """Test feedback creation endpoint"""
+    response = make_request(client, 'advisor', 'post', '/api/feedback', data=_CREATE_FEEDBACK_BODY)
+    assert response.status_code == 201
+    response_data = orjson.loads(response.data)
+    assert_keys(response_data, 'feedback', 'message')
+
+
+def test_get_thesis_feedback(client):
+    """Test get thesis feedback endpoint"""
+    response = make_request(client, 'student', 'get', f'/api/feedback/thesis/{IDS.thesis_id}')
+    assert response.status_code == 200
+    response_data = orjson.loads(response.data)
+    assert_keys(response_data, 'feedback', 'thesis_id', 'thesis_title')
+
+
+def test_get_feedback(client):
+    """Test get specific feedback endpoint"""
+    response = make_request(client, 'student', 'get', f'/api/feedback/{IDS.feedback_id}')
+    assert response.status_code == 200
+    response_data = orjson.loads(response.data)
+    assert str(response_data['id']) == str(IDS.feedback_id)
+
+
+_UPDATE_FEEDBACK_BODY = orjson.dumps({
+    'overall_comments': 'Updated feedback comments',
+    'rating': 5,
+    'recommendations': 'Updated recommendations'
+})
+
+
+def test_update_feedback(client):
+    """Test feedback update endpoint"""
+    response = make_request(client, 'advisor', 'put', f'/api/feedback/{IDS.feedback_id}', data=_UPDATE_FEEDBACK_BODY)
+    assert response.status_code == 200
+    response_data = orjson.loads(response.data)
+    assert_keys(response_data, 'message', 'feedback')
+
+
+def test_export_feedback(client):
+    """Test feedback export endpoint"""
+    response = make_request(client, 'student', 'get', f'/api/feedback/{IDS.feedback_id}/export')
+    assert response.status_code == 200
+    assert 'application/pdf' in response.headers['Content-Type']
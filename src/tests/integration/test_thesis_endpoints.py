@@ -0,0 +1,105 @@
+import orjson
+import pytest
+
+from src.tests.integration.fixtures import IDS, assert_keys, create_mock_thesis, make_request
+
+
+@pytest.fixture
+def client(endpoint_client, thesis_mocks):
+    """Return the shared test client with the thesis route mocks configured"""
+    return endpoint_client
+
+
+_CREATE_THESIS_BODY = orjson.dumps({
+    'title': 'New Test Thesis',
+    'thesis_type': 'masters',
+    'description': 'This is a test thesis',
+    'metadata': {'keywords': ['test', 'api']}
+})
+
+
+def test_create_thesis(client):
+    """Test thesis creation endpoint"""
+    response = make_request(client, 'student', 'post', '/api/theses', data=_CREATE_THESIS_BODY)
+    assert response.status_code == 201
+    response_data = orjson.loads(response.data)
+    assert_keys(response_data, 'thesis', 'message')
+
+
+def test_get_theses(client):
+    """Test get theses endpoint"""
+    response = make_request(client, 'student', 'get', '/api/theses')
+    assert response.status_code == 200
+    response_data = orjson.loads(response.data)
+    assert_keys(response_data, 'theses', 'count')
+
+
+def test_get_thesis(client):
+    """Test get specific thesis endpoint"""
+    response = make_request(client, 'student', 'get', f'/api/theses/{IDS.thesis_id}')
+    assert response.status_code == 200
+    response_data = orjson.loads(response.data)
+    assert str(response_data['id']) == str(IDS.thesis_id)
+
+
+_THESIS_UPDATE_BODY = orjson.dumps({
+    'title': 'Updated Thesis Title',
+    'description': 'Updated thesis description'
+})
+
+
+def test_update_thesis(client):
+    """Test thesis update endpoint"""
+    response = make_request(client, 'student', 'put', f'/api/theses/{IDS.thesis_id}', data=_THESIS_UPDATE_BODY)
+    assert response.status_code == 200
+    response_data = orjson.loads(response.data)
+    assert_keys(response_data, 'message', 'thesis')
+
+
+_THESIS_STATUS_BODY = orjson.dumps({
+    'status': 'submitted',
+    'comments': 'Submitting thesis for review'
+})
+
+
+def test_update_thesis_status(client):
+    """Test thesis status update endpoint"""
+    response = make_request(client, 'student', 'put', f'/api/theses/{IDS.thesis_id}/status', data=_THESIS_STATUS_BODY)
+    assert response.status_code == 200
+    response_data = orjson.loads(response.data)
+    assert_keys(response_data, 'message', 'thesis')
+
+
+def test_download_thesis(client):
+    """Test thesis download endpoint"""
+    response = make_request(client, 'student', 'get', f'/api/theses/{IDS.thesis_id}/download')
+    assert response.status_code == 200
+    assert 'application/pdf' in response.headers['Content-Type']
+
+
+@pytest.fixture
+def unassigned_thesis(thesis_mocks):
+    """Serve a thesis with no advisor assigned, restoring the default afterwards"""
+    thesis_repo = thesis_mocks['thesis_repository']
+    original_thesis = thesis_repo.get_by_id.return_value
+
+    # Create a new unassigned thesis (with advisor_id = None)
+    thesis = create_mock_thesis(IDS.thesis_id, IDS.student_id, advisor_id=None)
+    thesis_repo.get_by_id.return_value = thesis
+
+    yield thesis
+
+    # Restore original mocks for other tests
+    thesis_repo.get_by_id.return_value = original_thesis
+
+
+def test_assign_advisor(client, unassigned_thesis):
+    """Test advisor assignment endpoint"""
+    # Make the API request as an advisor
+    response = make_request(client, 'advisor', 'post', f'/api/theses/{IDS.thesis_id}/assign')
+    response_data = orjson.loads(response.data)
+    
+    # Verify the response
+    assert response.status_code == 200
+    assert_keys(response_data, 'message', 'thesis')
+    assert 'advisor_id' in response_data['thesis']
@@ -1,17 +1,20 @@
-import unittest
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add the project root directory to the path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
 
 if __name__ == "__main__":
-    # Discover all tests in the tests directory
-    test_suite = unittest.defaultTestLoader.discover('src/tests', pattern='test_*.py')
-    
-    # Run the tests
-    test_runner = unittest.TextTestRunner(verbosity=2)
-    result = test_runner.run(test_suite)
-    
-    # Exit with non-zero code if tests failed
-    sys.exit(not result.wasSuccessful()) 
\ No newline at end of file
+    # Leave two cores free for the rest of the machine
+    workers = max((os.cpu_count() or 1) - 2, 1)
+
+    # loadfile keeps each module on one worker so its fixtures are built once
+    sys.exit(pytest.main([
+        str(PROJECT_ROOT / "src" / "tests"),
+        "-n", str(workers),
+        "--dist=loadfile",
+    ]))
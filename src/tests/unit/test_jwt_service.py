@@ -0,0 +1,229 @@
+import os
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import redis
+
+from src.infrastructure.services import jwt_service
+from src.infrastructure.services.jwt_service import JwtService, REVOKED_KEY_PREFIX
+
+
+class FakeRedis:
+    """In-memory stand-in for the few Redis commands the blacklist uses"""
+
+    def __init__(self):
+        self.store = {}
+        self.exists_calls = 0
+        self.fail = False
+
+    def set(self, key, value, exat=None):
+        if self.fail:
+            raise redis.ConnectionError("Redis unavailable")
+        self.store[key] = value
+
+    def exists(self, key):
+        self.exists_calls += 1
+        if self.fail:
+            raise redis.TimeoutError("Redis timed out")
+        return int(key in self.store)
+
+
+def make_service(fake_redis=None):
+    """Create a JwtService with mocked dependencies and an optional fake Redis"""
+    with patch.dict(os.environ, {}, clear=False):
+        os.environ.pop("REDIS_URL", None)
+        service = JwtService(MagicMock(), MagicMock())
+    service._redis = fake_redis
+    return service
+
+
+class TestTokenRevocation(unittest.TestCase):
+    """Test the in-process (L1) and Redis (L2) token blacklist"""
+
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.service = make_service(self.redis)
+        self.token = self.service.create_access_token(uuid4())
+
+    def test_revoke_then_verify_without_redis(self):
+        """Test that a revoked token is rejected by the in-process blacklist"""
+        service = make_service()
+        token = service.create_access_token(uuid4())
+
+        self.assertTrue(service.revoke_token(token))
+
+        is_valid, payload = service.verify_token(token)
+        self.assertFalse(is_valid)
+        self.assertEqual(payload["error"], "Token has been revoked")
+
+    def test_revocation_is_shared_through_redis(self):
+        """Test that a token revoked by one worker is rejected by another"""
+        other_worker = make_service(self.redis)
+
+        self.assertTrue(self.service.revoke_token(self.token))
+
+        self.assertIn(REVOKED_KEY_PREFIX + self.service._token_key(self.token), self.redis.store)
+        self.assertFalse(other_worker.verify_token(self.token)[0])
+
+    def test_redis_hit_is_remembered_locally(self):
+        """Test that a revocation found in Redis is not looked up again"""
+        other_worker = make_service(self.redis)
+        self.service.revoke_token(self.token)
+
+        other_worker.verify_token(self.token)
+        calls = self.redis.exists_calls
+        other_worker.verify_token(self.token)
+
+        self.assertEqual(self.redis.exists_calls, calls)
+
+    def test_valid_token_skips_redis_within_ttl(self):
+        """Test that a token Redis reported as not revoked is not re-checked right away"""
+        self.assertTrue(self.service.verify_token(self.token)[0])
+        self.assertTrue(self.service.verify_token(self.token)[0])
+
+        self.assertEqual(self.redis.exists_calls, 1)
+
+    def test_valid_token_rechecked_after_ttl(self):
+        """Test that the not-revoked cache expires"""
+        self.service.verify_token(self.token)
+
+        with patch.object(jwt_service.time, "time", return_value=time.time() + jwt_service.NOT_REVOKED_CACHE_TTL + 1):
+            self.service.verify_token(self.token)
+
+        self.assertEqual(self.redis.exists_calls, 2)
+
+    def test_local_revoke_clears_not_revoked_cache(self):
+        """Test that revoking a token on this worker applies immediately"""
+        self.assertTrue(self.service.verify_token(self.token)[0])
+
+        self.service.revoke_token(self.token)
+
+        self.assertFalse(self.service.verify_token(self.token)[0])
+
+    def test_redis_failure_fails_open(self):
+        """Test that an unreachable Redis falls back to the in-process blacklist"""
+        self.redis.fail = True
+
+        self.assertTrue(self.service.verify_token(self.token)[0])
+
+        # Failures are not cached as "not revoked"
+        self.assertTrue(self.service.verify_token(self.token)[0])
+        self.assertEqual(self.redis.exists_calls, 2)
+
+        # Revocation still applies locally when Redis cannot store it
+        self.assertTrue(self.service.revoke_token(self.token))
+        self.assertFalse(self.service.verify_token(self.token)[0])
+
+    def test_blacklist_without_redis_keeps_live_entries(self):
+        """Test that unexpired entries are never evicted when there is no Redis"""
+        service = make_service()
+        exp = int(time.time()) + 3600
+
+        with patch.object(jwt_service, "REVOKED_CACHE_SIZE", 2):
+            service._revoked_purge_at = 2
+            for i in range(5):
+                service._remember_revoked(f"key-{i}", exp)
+
+        self.assertEqual(len(service._revoked), 5)
+
+    def test_blacklist_without_redis_purges_expired_entries(self):
+        """Test that expired entries are dropped once the purge threshold is reached"""
+        service = make_service()
+        service._revoked_purge_at = 2
+        service._remember_revoked("expired", int(time.time()) - 1)
+        service._remember_revoked("live", int(time.time()) + 3600)
+
+        service._remember_revoked("new", int(time.time()) + 3600)
+
+        self.assertEqual(set(service._revoked), {"live", "new"})
+
+    def test_blacklist_with_redis_is_bounded(self):
+        """Test that the L1 evicts the oldest live entry when Redis holds the full list"""
+        exp = int(time.time()) + 3600
+
+        with patch.object(jwt_service, "REVOKED_CACHE_SIZE", 2):
+            self.service._revoked_purge_at = 2
+            for i in range(5):
+                self.service._remember_revoked(f"key-{i}", exp)
+
+        self.assertLessEqual(len(self.service._revoked), 2)
+        self.assertIn("key-4", self.service._revoked)
+
+
+class TestTokenClaimsCache(unittest.TestCase):
+    """Test caching of decoded token claims"""
+
+    def setUp(self):
+        self.service = make_service()
+        self.user_id = uuid4()
+        self.token = self.service.create_access_token(self.user_id)
+
+    def test_cache_hit_skips_decode(self):
+        """Test that a repeat verification reuses the decoded claims"""
+        self.assertTrue(self.service.verify_token(self.token)[0])
+
+        with patch.object(jwt_service.jwt, "decode") as mock_decode:
+            is_valid, payload = self.service.verify_token(self.token)
+
+        mock_decode.assert_not_called()
+        self.assertTrue(is_valid)
+        self.assertEqual(payload["sub"], str(self.user_id))
+
+    def test_cache_entry_expires(self):
+        """Test that claims are decoded again once the cache TTL runs out"""
+        self.service.verify_token(self.token)
+        later = time.time() + jwt_service.TOKEN_CACHE_TTL + 1
+
+        with patch.object(jwt_service.time, "time", return_value=later), \
+                patch.object(jwt_service.jwt, "decode", wraps=jwt_service.jwt.decode) as mock_decode:
+            self.assertTrue(self.service.verify_token(self.token)[0])
+
+        mock_decode.assert_called_once()
+
+    def test_expired_token_is_not_served_from_cache(self):
+        """Test that the cache never outlives the token's exp"""
+        service = make_service()
+        service.access_token_expires = 1
+        token = service.create_access_token(self.user_id)
+        _, payload = service.verify_token(token)
+
+        self.assertLessEqual(service._verified[service._token_key(token)][1], payload["exp"])
+
+        # Past exp the cache entry is stale, so the token goes back through jwt.decode
+        with patch.object(jwt_service.time, "time", return_value=payload["exp"] + 1), \
+                patch.object(jwt_service.jwt, "decode",
+                             side_effect=jwt_service.jwt.ExpiredSignatureError("Signature has expired")):
+            is_valid, payload = service.verify_token(token)
+
+        self.assertFalse(is_valid)
+        self.assertEqual(payload["error"], "Signature has expired")
+
+    def test_revoke_invalidates_cache(self):
+        """Test that revoking a cached token rejects it on the next verification"""
+        self.assertTrue(self.service.verify_token(self.token)[0])
+
+        self.service.revoke_token(self.token)
+
+        self.assertNotIn(self.service._token_key(self.token), self.service._verified)
+        self.assertFalse(self.service.verify_token(self.token)[0])
+
+    def test_returned_claims_are_a_copy(self):
+        """Test that mutating the returned claims does not change the cache"""
+        _, payload = self.service.verify_token(self.token)
+        payload["sub"] = "tampered"
+
+        _, payload = self.service.verify_token(self.token)
+
+        self.assertEqual(payload["sub"], str(self.user_id))
+
+    def test_token_without_exp_is_rejected(self):
+        """Test that a validly signed token without exp is invalid instead of raising"""
+        token = jwt_service.jwt.encode({"sub": str(self.user_id), "type": "access"},
+                                       self.service._secret_bytes, algorithm=self.service.algorithm)
+
+        is_valid, payload = self.service.verify_token(token)
+
+        self.assertFalse(is_valid)
+        self.assertIn("exp", payload["error"])
@@ -0,0 +1,159 @@
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.exceptions.domain_exceptions import ValidationException
+from src.domain.value_objects.status import NotificationType
+from src.infrastructure.database.models.notification_model import NotificationModel
+from src.infrastructure.repositories.notification_repository_impl import NotificationRepositoryImpl
+
+
+def make_notification(user_id, **overrides):
+    """Build a notification record like EmailNotificationService does"""
+    notification = {
+        "id": uuid4(),
+        "user_id": user_id,
+        "type": NotificationType.NEW_SUBMISSION.value,
+        "data": {"thesis_title": "Test Thesis"},
+        "is_read": False,
+        "created_at": datetime(2024, 1, 1),
+    }
+    notification.update(overrides)
+    return notification
+
+
+class TestNotificationModel(unittest.TestCase):
+    """Test conversions between notification records and the model"""
+
+    def test_mapping_from_dict_stringifies_ids(self):
+        """Test that UUIDs are stored as CHAR(36) strings"""
+        notification = make_notification(uuid4())
+
+        mapping = NotificationModel.mapping_from_dict(notification)
+
+        self.assertEqual(mapping["id"], str(notification["id"]))
+        self.assertEqual(mapping["user_id"], str(notification["user_id"]))
+        self.assertEqual(mapping["type"], "new_submission")
+        self.assertEqual(mapping["data"], {"thesis_title": "Test Thesis"})
+        self.assertFalse(mapping["is_read"])
+        self.assertEqual(mapping["created_at"], datetime(2024, 1, 1))
+
+    def test_mapping_from_dict_defaults(self):
+        """Test that optional fields fall back to defaults"""
+        notification = make_notification(uuid4())
+        del notification["data"], notification["is_read"], notification["created_at"]
+
+        mapping = NotificationModel.mapping_from_dict(notification)
+
+        self.assertIsNone(mapping["data"])
+        self.assertFalse(mapping["is_read"])
+        self.assertIsNone(mapping["created_at"])
+
+    def test_to_dict_round_trip(self):
+        """Test that from_dict followed by to_dict returns the original record"""
+        notification = make_notification(uuid4())
+
+        record = NotificationModel.from_dict(notification).to_dict()
+
+        self.assertEqual(record, notification)
+        self.assertIsInstance(record["id"], UUID)
+        self.assertIsInstance(record["user_id"], UUID)
+
+    def test_to_dict_empty_data(self):
+        """Test that missing data is returned as an empty dict"""
+        record = NotificationModel.from_dict(make_notification(uuid4(), data=None)).to_dict()
+
+        self.assertEqual(record["data"], {})
+
+
+class TestNotificationRepository(unittest.TestCase):
+    """Test the SQLAlchemy notification repository against in-memory SQLite"""
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        NotificationModel.__table__.create(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.repository = NotificationRepositoryImpl(self.session)
+        self.user_id = uuid4()
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_create(self):
+        """Test creating a single notification"""
+        notification = make_notification(self.user_id)
+
+        created = self.repository.create(notification)
+
+        self.assertEqual(created, notification)
+        self.assertEqual(self.repository.get_by_user(self.user_id), [notification])
+
+    def test_create_many(self):
+        """Test that a batch insert stores every notification"""
+        notifications = [
+            make_notification(self.user_id, created_at=datetime(2024, 1, day))
+            for day in (1, 2, 3)
+        ]
+
+        count = self.repository.create_many(notifications)
+
+        self.assertEqual(count, 3)
+        self.assertEqual(self.repository.count_unread(self.user_id), 3)
+
+    def test_create_many_empty(self):
+        """Test that an empty batch does not touch the session"""
+        session = MagicMock()
+
+        self.assertEqual(NotificationRepositoryImpl(session).create_many([]), 0)
+        session.commit.assert_not_called()
+
+    def test_get_by_user_newest_first(self):
+        """Test that notifications are returned newest first and paginated"""
+        older = make_notification(self.user_id, created_at=datetime(2024, 1, 1))
+        newer = make_notification(self.user_id, created_at=datetime(2024, 1, 2))
+        self.repository.create_many([older, newer, make_notification(uuid4())])
+
+        self.assertEqual(
+            [n["id"] for n in self.repository.get_by_user(self.user_id)],
+            [newer["id"], older["id"]]
+        )
+        self.assertEqual(
+            [n["id"] for n in self.repository.get_by_user(self.user_id, limit=1, offset=1)],
+            [older["id"]]
+        )
+
+    def test_mark_as_read(self):
+        """Test marking a single notification as read"""
+        notification = self.repository.create(make_notification(self.user_id))
+
+        self.assertTrue(self.repository.mark_as_read(notification["id"]))
+        self.assertEqual(self.repository.count_unread(self.user_id), 0)
+        self.assertFalse(self.repository.mark_as_read(uuid4()))
+
+    def test_mark_all_as_read(self):
+        """Test marking every unread notification of a user as read"""
+        self.repository.create_many([make_notification(self.user_id) for _ in range(2)])
+        other_user = uuid4()
+        self.repository.create(make_notification(other_user))
+
+        self.assertEqual(self.repository.mark_all_as_read(self.user_id), 2)
+        self.assertEqual(self.repository.count_unread(self.user_id), 0)
+        self.assertEqual(self.repository.count_unread(other_user), 1)
+
+    def test_create_failure_raises_validation_error(self):
+        """Test that database errors are rolled back and reported as ValidationException"""
+        session = MagicMock()
+        session.commit.side_effect = SQLAlchemyError("insert failed")
+        repository = NotificationRepositoryImpl(session)
+
+        with self.assertRaises(ValidationException):
+            repository.create(make_notification(self.user_id))
+        with self.assertRaises(ValidationException):
+            repository.create_many([make_notification(self.user_id)])
+        self.assertEqual(session.rollback.call_count, 2)
@@ -0,0 +1,149 @@
+import unittest
+from types import SimpleNamespace
+from uuid import uuid4
+
+from flask import Flask, g
+
+from src.domain.value_objects.status import UserRole
+from src.utils.rbac_utils import (
+    get_user_permissions, has_permission, require_assigned_permission,
+    require_own_permission, require_permission
+)
+
+
+def make_user(role, user_id=None):
+    """Create a minimal user with the attributes the RBAC checks read"""
+    return SimpleNamespace(id=user_id or uuid4(), role=role)
+
+
+def view(**kwargs):
+    """Route body returned when every check passes"""
+    return "ok"
+
+
+class TestRbacUtils(unittest.TestCase):
+    """Test the role-based access control decorators"""
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.student = make_user(UserRole.STUDENT)
+        self.advisor = make_user(UserRole.ADVISOR)
+        self.admin = make_user(UserRole.ADMIN)
+
+    def call(self, decorated, user=None, thesis=None, **kwargs):
+        """Run a decorated view inside a request context as the given user"""
+        with self.app.test_request_context('/test'):
+            if user is not None:
+                g.user = user
+            if thesis is not None:
+                g.thesis = thesis
+            return decorated(**kwargs)
+
+    def assertDenied(self, result, status, message=None):
+        """Assert that a check returned a JSON denial"""
+        self.assertNotEqual(result, "ok")
+        self.assertEqual(result.status_code, status)
+        self.assertEqual(result.mimetype, "application/json")
+        if message is not None:
+            self.assertEqual(result.get_json()["message"], message)
+
+    def test_unauthenticated_returns_401(self):
+        """Test that every decorator rejects a request without g.user"""
+        decorated_views = (
+            require_permission("thesis:create")(view),
+            require_own_permission("thesis:read_own", lambda req, kwargs: kwargs["user_id"])(view),
+            require_assigned_permission("thesis:read_assigned")(view),
+        )
+
+        for decorated in decorated_views:
+            self.assertDenied(self.call(decorated, user_id=uuid4()), 401)
+
+    def test_role_permission(self):
+        """Test that a role-only check allows roles with the permission"""
+        decorated = require_permission("thesis:create")(view)
+
+        self.assertEqual(self.call(decorated, self.student), "ok")
+        self.assertDenied(self.call(decorated, self.advisor), 403)
+
+    def test_owner_allowed_non_owner_denied(self):
+        """Test the ownership check against the resource owner ID"""
+        decorated = require_permission(
+            "thesis:read_own", lambda req, kwargs: kwargs["owner_id"]
+        )(view)
+
+        self.assertEqual(self.call(decorated, self.student, owner_id=self.student.id), "ok")
+        self.assertDenied(
+            self.call(decorated, self.student, owner_id=uuid4()),
+            403, "You can only access your own resources"
+        )
+
+    def test_own_permission_requires_role(self):
+        """Test that owning the resource is not enough without the permission"""
+        decorated = require_own_permission(
+            "thesis:read_own", lambda req, kwargs: kwargs["owner_id"]
+        )(view)
+
+        self.assertDenied(
+            self.call(decorated, self.advisor, owner_id=self.advisor.id),
+            403, "You do not have permission to access this resource"
+        )
+
+    def test_assigned_thesis_allowed_unassigned_denied(self):
+        """Test the assignment check against the thesis on g"""
+        decorated = require_permission("thesis:read_assigned", lambda req, kwargs: None)(view)
+        assigned = SimpleNamespace(advisor_id=self.advisor.id)
+
+        self.assertEqual(self.call(decorated, self.advisor, thesis=assigned), "ok")
+        for thesis in (SimpleNamespace(advisor_id=uuid4()), SimpleNamespace(advisor_id=None)):
+            self.assertDenied(
+                self.call(decorated, self.advisor, thesis=thesis),
+                403, "You can only access theses assigned to you"
+            )
+
+    def test_assigned_without_thesis_checks_role_only(self):
+        """Test that the assignment check is skipped until a thesis is loaded"""
+        decorated = require_assigned_permission("thesis:read_assigned")(view)
+
+        self.assertEqual(self.call(decorated, self.advisor), "ok")
+        self.assertDenied(self.call(decorated, self.student), 403)
+
+    def test_admin_bypasses_checks(self):
+        """Test that admins pass role, ownership and assignment checks"""
+        decorated_views = (
+            require_permission("thesis:read_own", lambda req, kwargs: uuid4())(view),
+            require_permission("thesis:read_assigned", lambda req, kwargs: None)(view),
+            require_permission("thesis:read_own")(view),
+        )
+
+        for decorated in decorated_views:
+            self.assertEqual(self.call(decorated, self.admin, thesis=SimpleNamespace(advisor_id=uuid4())), "ok")
+
+    def test_unknown_permission(self):
+        """Test that unknown permissions are denied to every role but admin"""
+        decorated = require_permission("thesis:unknown")(view)
+
+        self.assertDenied(self.call(decorated, self.student), 403)
+        self.assertDenied(self.call(decorated, self.advisor), 403)
+        self.assertEqual(self.call(decorated, self.admin), "ok")
+
+    def test_has_permission(self):
+        """Test permission lookups for the current user"""
+        with self.app.test_request_context('/test'):
+            self.assertFalse(has_permission("thesis:create"))
+
+            g.user = self.student
+            self.assertTrue(has_permission("thesis:create"))
+            self.assertFalse(has_permission("thesis:read_any"))
+            self.assertFalse(has_permission("thesis:unknown"))
+
+            # The cached context follows a replaced g.user
+            g.user = self.admin
+            self.assertTrue(has_permission("thesis:read_any"))
+
+    def test_get_user_permissions(self):
+        """Test that role permissions are returned as a tuple"""
+        permissions = get_user_permissions(UserRole.ADVISOR)
+
+        self.assertIsInstance(permissions, tuple)
+        self.assertIn("thesis:read_assigned", permissions)
+        self.assertNotIn("thesis:create", permissions)
@@ -1,8 +1,17 @@
-import re
 import secrets
 import string
 from typing import Tuple, Optional
 
+# Characters accepted as the special character in a strong password
+_SPECIAL_CHARS = '!@#$%^&*(),.?":{}|<>'
+_SPECIALS = frozenset(_SPECIAL_CHARS)
+
+# Alphabet for the random part of generated passwords
+_PASSWORD_CHARS = string.ascii_lowercase + string.ascii_uppercase + string.digits + _SPECIAL_CHARS
+
+# Masks for the hidden part of usernames up to 63 characters
+_STARS = tuple('*' * i for i in range(64))
+
 
 def validate_password_strength(password: str) -> Tuple[bool, Optional[str]]:
     """
@@ -18,21 +27,27 @@ def validate_password_strength(password: str) -> Tuple[bool, Optional[str]]:
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
 
-    # Check for lowercase
-    if not any(c.islower() for c in password):
+    # Classify every character in one pass, stopping once all classes are seen
+    has_lower = has_upper = has_digit = has_special = False
+    for c in password:
+        if c.islower():
+            has_lower = True
+        elif c.isupper():
+            has_upper = True
+        elif c.isdigit():
+            has_digit = True
+        elif c in _SPECIALS:
+            has_special = True
+        if has_lower and has_upper and has_digit and has_special:
+            break
+
+    if not has_lower:
         return False, "Password must contain at least one lowercase letter"
-
-    # Check for uppercase
-    if not any(c.isupper() for c in password):
+    if not has_upper:
         return False, "Password must contain at least one uppercase letter"
-
-    # Check for digit
-    if not any(c.isdigit() for c in password):
+    if not has_digit:
         return False, "Password must contain at least one digit"
-
-    # Check for special character
-    special_chars = r'[!@#$%^&*(),.?":{}|<>]'
-    if not re.search(special_chars, password):
+    if not has_special:
         return False, "Password must contain at least one special character"
 
     return True, None
@@ -48,28 +63,22 @@ def generate_random_password(length: int = 12) -> str:
     Returns:
         Randomly generated password
     """
-    # Define character sets
-    lowercase = string.ascii_lowercase
-    uppercase = string.ascii_uppercase
-    digits = string.digits
-    special = '!@#$%^&*(),.?":{}|<>'
-
     # Ensure at least one of each type
     password = [
-        secrets.choice(lowercase),
-        secrets.choice(uppercase),
-        secrets.choice(digits),
-        secrets.choice(special)
+        secrets.choice(string.ascii_lowercase),
+        secrets.choice(string.ascii_uppercase),
+        secrets.choice(string.digits),
+        secrets.choice(_SPECIAL_CHARS)
     ]
 
     # Fill the rest with random characters
     remaining = length - 4
-    all_chars = lowercase + uppercase + digits + special
-
-    password.extend(secrets.choice(all_chars) for _ in range(remaining))
+    password.extend(secrets.choice(_PASSWORD_CHARS) for _ in range(remaining))
 
-    # Shuffle the password
-    secrets.SystemRandom().shuffle(password)
+    # Shuffle the password (Fisher-Yates, drawing straight from the OS CSPRNG)
+    for i in range(len(password) - 1, 0, -1):
+        j = secrets.randbelow(i + 1)
+        password[i], password[j] = password[j], password[i]
 
     return ''.join(password)
 
@@ -91,9 +100,8 @@ def mask_email(email: str) -> str:
 
     # Show only first and last character of username
     if len(username) <= 2:
-        masked_username = username
-    else:
-        masked_username = username[0] + '*' * \
-            (len(username) - 2) + username[-1]
+        return f"{username}@{domain}"
 
-    return f"{masked_username}@{domain}"
+    hidden = len(username) - 2
+    stars = _STARS[hidden] if hidden < len(_STARS) else '*' * hidden
+    return f"{username[0]}{stars}{username[-1]}@{domain}"
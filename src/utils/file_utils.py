@@ -1,9 +1,51 @@
 import os
 import mimetypes
-import uuid
+import secrets
 import hashlib
 from typing import Tuple, Dict, List, Optional, BinaryIO
 import io
+from functools import lru_cache, partial
+
+# Load the MIME type maps at import instead of on the first request
+mimetypes.init()
+
+# Read size when hashing without hashlib.file_digest
+HASH_CHUNK_SIZE = 1 << 20
+
+# Direct constructors for common algorithms, others go through hashlib.new
+_HASHERS = {
+    'sha256': hashlib.sha256,
+    'sha1': hashlib.sha1,
+    'md5': hashlib.md5,
+    'blake2b': hashlib.blake2b,
+}
+
+# Leading bytes of supported document types: %PDF and the DOCX/ZIP PK\x03\x04
+_FILE_SIGNATURES = {
+    b'%PDF': 'pdf',
+    b'PK\x03\x04': 'docx',
+}
+
+# Pillow format plugins to try for each image MIME type
+_PIL_FORMATS_BY_MIMETYPE = {
+    'image/jpeg': ['JPEG'],
+    'image/png': ['PNG'],
+    'image/webp': ['WEBP'],
+    'image/gif': ['GIF'],
+}
+
+# Characters kept as-is by get_safe_filename
+_SAFE_FILENAME_CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_."
+
+
+class _SafeFilenameTable(dict):
+    """str.translate table that maps any character not in the table to '_'"""
+
+    def __missing__(self, codepoint: int) -> int:
+        return ord('_')
+
+
+_SAFE_FILENAME_TABLE = _SafeFilenameTable({ord(c): ord(c) for c in _SAFE_FILENAME_CHARS})
 
 
 def get_file_extension(filename: str) -> str:
@@ -29,7 +71,20 @@ def get_file_mimetype(filename: str) -> str:
     Returns:
         MIME type
     """
-    mime_type, _ = mimetypes.guess_type(filename)
+    ext = os.path.splitext(filename)[1]
+
+    # Compressed files like .tar.gz need the full name to guess the type
+    if ext.lower() in mimetypes.encodings_map:
+        mime_type, _ = mimetypes.guess_type(filename)
+        return mime_type or "application/octet-stream"
+
+    return _mimetype_for_extension(ext)
+
+
+@lru_cache(maxsize=256)
+def _mimetype_for_extension(ext: str) -> str:
+    """Guess the MIME type for an extension, cached since uploads reuse a few"""
+    mime_type, _ = mimetypes.guess_type(f"file{ext}")
     return mime_type or "application/octet-stream"
 
 
@@ -44,7 +99,7 @@ def generate_unique_filename(original_filename: str) -> str:
         Unique filename
     """
     ext = get_file_extension(original_filename)
-    unique_id = str(uuid.uuid4())
+    unique_id = secrets.token_hex(16)
     return f"{unique_id}.{ext}" if ext else unique_id
 
 
@@ -59,7 +114,7 @@ def calculate_file_hash(file_data: BinaryIO, algorithm: str = 'sha256') -> str:
     Returns:
         File hash
     """
-    hasher = hashlib.new(algorithm)
+    hasher = _HASHERS.get(algorithm) or partial(hashlib.new, algorithm)
 
     # Save current position
     current_pos = file_data.tell()
@@ -67,18 +122,23 @@ def calculate_file_hash(file_data: BinaryIO, algorithm: str = 'sha256') -> str:
     # Reset to beginning
     file_data.seek(0)
 
-    # Read in chunks to handle large files
-    chunk_size = 8192
-    while True:
-        data = file_data.read(chunk_size)
-        if not data:
-            break
-        hasher.update(data)
-
-    # Restore position
-    file_data.seek(current_pos)
+    try:
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+ hashes through a reusable buffer without Python-level reads
+            digest = hashlib.file_digest(file_data, hasher)
+        else:
+            # Read in chunks to handle large files
+            digest = hasher()
+            while True:
+                data = file_data.read(HASH_CHUNK_SIZE)
+                if not data:
+                    break
+                digest.update(data)
+    finally:
+        # Restore position, also when the algorithm is unknown
+        file_data.seek(current_pos)
 
-    return hasher.hexdigest()
+    return digest.hexdigest()
 
 
 def get_safe_filename(filename: str) -> str:
@@ -92,8 +152,7 @@ def get_safe_filename(filename: str) -> str:
         Safe filename
     """
     # Remove potentially dangerous characters
-    safe_chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_."
-    safe_name = ''.join(c if c in safe_chars else '_' for c in filename)
+    safe_name = filename.translate(_SAFE_FILENAME_TABLE)
 
     # Limit length
     if len(safe_name) > 100:
@@ -103,15 +162,15 @@ def get_safe_filename(filename: str) -> str:
     return safe_name
 
 
-def is_pdf_file(file_data: BinaryIO) -> bool:
+def detect_file_type(file_data: BinaryIO) -> Optional[str]:
     """
-    Check if file is a PDF by examining its header
+    Detect a file's type by examining its header
     
     Args:
         file_data: File data
         
     Returns:
-        True if file is a PDF, False otherwise
+        'pdf' or 'docx', or None if the signature is not recognised
     """
     # Save current position
     current_pos = file_data.tell()
@@ -119,14 +178,26 @@ def is_pdf_file(file_data: BinaryIO) -> bool:
     # Reset to beginning
     file_data.seek(0)
 
-    # Read header (first 4 bytes)
-    header = file_data.read(4)
+    # Read header once, long enough for any signature we check
+    header = file_data.read(8)
 
     # Restore position
     file_data.seek(current_pos)
 
-    # Check if header matches PDF signature (%PDF)
-    return header == b'%PDF'
+    return _FILE_SIGNATURES.get(header[:4])
+
+
+def is_pdf_file(file_data: BinaryIO) -> bool:
+    """
+    Check if file is a PDF by examining its header
+    
+    Args:
+        file_data: File data
+        
+    Returns:
+        True if file is a PDF, False otherwise
+    """
+    return detect_file_type(file_data) == 'pdf'
 
 
 def is_docx_file(file_data: BinaryIO) -> bool:
@@ -139,20 +210,7 @@ def is_docx_file(file_data: BinaryIO) -> bool:
     Returns:
         True if file is a DOCX, False otherwise
     """
-    # Save current position
-    current_pos = file_data.tell()
-
-    # Reset to beginning
-    file_data.seek(0)
-
-    # Read header (first 4 bytes)
-    header = file_data.read(4)
-
-    # Restore position
-    file_data.seek(current_pos)
-
-    # Check if header matches DOCX/ZIP signature (PK\x03\x04)
-    return header == b'PK\x03\x04'
+    return detect_file_type(file_data) == 'docx'
 
 
 def extract_text_from_pdf(file_data: BinaryIO) -> str:
@@ -166,7 +224,7 @@ def extract_text_from_pdf(file_data: BinaryIO) -> str:
         Extracted text
     """
     try:
-        from PyPDF2 import PdfReader
+        import pypdfium2 as pdfium
 
         # Save current position
         current_pos = file_data.tell()
@@ -174,13 +232,14 @@ def extract_text_from_pdf(file_data: BinaryIO) -> str:
         # Reset to beginning
         file_data.seek(0)
 
-        # Create PDF reader
-        pdf = PdfReader(file_data)
+        # Open with PDFium, which reads from file_data until closed
+        pdf = pdfium.PdfDocument(file_data)
 
         # Extract text from each page
-        text = ""
-        for page in pdf.pages:
-            text += page.extract_text() + "\n"
+        try:
+            text = "".join(page.get_textpage().get_text_bounded() + "\n" for page in pdf)
+        finally:
+            pdf.close()
 
         # Restore position
         file_data.seek(current_pos)
@@ -208,7 +267,7 @@ def create_thumbnail(file_data: BinaryIO, mimetype: str, max_size: Tuple[int, in
         return None
 
     try:
-        from PIL import Image
+        from PIL import Image, UnidentifiedImageError
 
         # Save current position
         current_pos = file_data.tell()
@@ -216,15 +275,23 @@ def create_thumbnail(file_data: BinaryIO, mimetype: str, max_size: Tuple[int, in
         # Reset to beginning
         file_data.seek(0)
 
-        # Open image
-        img = Image.open(file_data)
+        # Open image, trying only the format its MIME type names
+        try:
+            img = Image.open(file_data, formats=_PIL_FORMATS_BY_MIMETYPE.get(mimetype))
+        except UnidentifiedImageError:
+            # Mislabelled upload, let Pillow probe every format
+            file_data.seek(0)
+            img = Image.open(file_data)
+
+        # Let libjpeg decode JPEGs at a reduced scale, no-op for other formats
+        img.draft('RGB', max_size)
 
         # Resize image
-        img.thumbnail(max_size)
+        img.thumbnail(max_size, Image.Resampling.BILINEAR)
 
-        # Save thumbnail to memory
+        # Save thumbnail to memory in a single encode pass
         output = io.BytesIO()
-        img.save(output, format='JPEG', quality=85)
+        img.save(output, format='JPEG', quality=85, optimize=False, progressive=False)
 
         # Restore position
         file_data.seek(current_pos)
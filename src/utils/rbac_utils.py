@@ -1,62 +1,126 @@
-from typing import Dict, List, Set, Optional, Callable
-from functools import wraps
-from flask import request, g, jsonify
+import json
+import sys
+from typing import Dict, FrozenSet, Optional, Callable, Tuple
+from functools import lru_cache, wraps
+from flask import Response, request, g
 
 from src.domain.value_objects.status import UserRole
 
 
+# Permissions shared between roles, defined once and composed below
+_SELF_SERVICE_PERMS = frozenset({
+    "feedback:read_own",
+    "profile:read_own",
+    "profile:update_own",
+})
+_REVIEW_PERMS = frozenset({
+    "thesis:update_status",
+    "feedback:create",
+})
+
+# Student permissions
+_STUDENT_PERMS = _SELF_SERVICE_PERMS | {
+    "thesis:create",
+    "thesis:read_own",
+    "thesis:update_own",
+    "thesis:submit_own",
+    "thesis:delete_own",
+    "thesis:download_own",
+}
+
+# Advisor permissions
+_ADVISOR_PERMS = _SELF_SERVICE_PERMS | _REVIEW_PERMS | {
+    "thesis:read_assigned",
+    "thesis:read_department",
+    "thesis:assign_self",
+    "thesis:download_assigned",
+    "feedback:update_own",
+    "feedback:delete_own",
+}
+
+# Admin permissions (has all permissions, through the *_any variants)
+_ADMIN_PERMS = _REVIEW_PERMS | {
+    "thesis:create",
+    "thesis:read_any",
+    "thesis:update_any",
+    "thesis:delete_any",
+    "thesis:submit_any",
+    "thesis:download_any",
+    "thesis:assign_any",
+    "feedback:read_any",
+    "feedback:update_any",
+    "feedback:delete_any",
+    "user:create",
+    "user:read_any",
+    "user:update_any",
+    "user:delete_any",
+    "profile:read_any",
+    "profile:update_any",
+}
+
 # Define permissions as a set of actions
 PERMISSIONS = {
-    # Student permissions
-    UserRole.STUDENT.value: {
-        "thesis:create",
-        "thesis:read_own",
-        "thesis:update_own",
-        "thesis:submit_own",
-        "thesis:delete_own",
-        "thesis:download_own",
-        "feedback:read_own",
-        "profile:read_own",
-        "profile:update_own",
-    },
-
-    # Advisor permissions
-    UserRole.ADVISOR.value: {
-        "thesis:read_assigned",
-        "thesis:read_department",
-        "thesis:assign_self",
-        "thesis:update_status",
-        "thesis:download_assigned",
-        "feedback:create",
-        "feedback:read_own",
-        "feedback:update_own",
-        "feedback:delete_own",
-        "profile:read_own",
-        "profile:update_own",
-    },
-
-    # Admin permissions (has all permissions)
-    UserRole.ADMIN.value: {
-        "thesis:create",
-        "thesis:read_any",
-        "thesis:update_any",
-        "thesis:delete_any",
-        "thesis:submit_any",
-        "thesis:download_any",
-        "thesis:assign_any",
-        "thesis:update_status",
-        "feedback:create",
-        "feedback:read_any",
-        "feedback:update_any",
-        "feedback:delete_any",
-        "user:create",
-        "user:read_any",
-        "user:update_any",
-        "user:delete_any",
-        "profile:read_any",
-        "profile:update_any",
-    }
+    UserRole.STUDENT.value: _STUDENT_PERMS,
+    UserRole.ADVISOR.value: _ADVISOR_PERMS,
+    UserRole.ADMIN.value: _ADMIN_PERMS,
+}
+
+# Same table keyed by the enum member, so checks skip the .value lookup
+PERMISSIONS_BY_ROLE: Dict[UserRole, FrozenSet[str]] = {role: PERMISSIONS[role.value] for role in UserRole}
+
+# One bit per permission and one mask per role, so a check is a single AND.
+# Keys are interned so interned callers match on identity before comparing text
+_PERM_BITS: Dict[str, int] = {
+    sys.intern(perm): 1 << i for i, perm in enumerate(sorted(frozenset().union(*PERMISSIONS.values())))
 }
+_ROLE_MASKS: Dict[UserRole, int] = {
+    role: sum(_PERM_BITS[perm] for perm in perms) for role, perms in PERMISSIONS_BY_ROLE.items()
+}
+
+_EMPTY: FrozenSet[str] = frozenset()
+_ADMIN = UserRole.ADMIN
+
+
+def _encode_denial(error: str, message: str) -> bytes:
+    """Encode a constant error payload the way jsonify would"""
+    return (json.dumps({"error": error, "message": message}, separators=(",", ":")) + "\n").encode()
+
+
+# Denial bodies are constant, so they are encoded once at import
+_AUTH_REQUIRED = _encode_denial("Authentication required", "You must be logged in to access this resource")
+_PERMISSION_DENIED = _encode_denial("Permission denied", "You do not have permission to access this resource")
+_NOT_OWNER = _encode_denial("Permission denied", "You can only access your own resources")
+_NOT_ASSIGNED = _encode_denial("Permission denied", "You can only access theses assigned to you")
+
+
+def _denied(body: bytes, status: int) -> Response:
+    """Build a JSON error response from a pre-encoded body"""
+    # A fresh Response per request, since after_request hooks (CORS) mutate headers
+    return Response(body, status=status, mimetype="application/json")
+
+
+class _PermCtx:
+    """Permission state for the current user, resolved once per request"""
+    __slots__ = ('user', 'role', 'perm_mask', 'user_id')
+
+    def __init__(self, user):
+        self.user = user
+        self.role = user.role
+        self.perm_mask = _ROLE_MASKS.get(user.role, 0)
+        self.user_id = str(user.id)
+
+
+def _perm_ctx() -> Optional[_PermCtx]:
+    """Return the permission context for the current g.user, building it on first use"""
+    user = getattr(g, 'user', None)
+    if user is None:
+        return None
+
+    # Rebuilt if g.user was replaced since the context was cached
+    ctx = getattr(g, '_perm_ctx', None)
+    if ctx is None or ctx.user is not user:
+        ctx = g._perm_ctx = _PermCtx(user)
+    return ctx
 
 
 def has_permission(permission: str) -> bool:
@@ -69,67 +133,101 @@ def has_permission(permission: str) -> bool:
     Returns:
         True if user has permission, False otherwise
     """
-    # Check if user is authenticated
-    if not hasattr(g, 'user'):
-        return False
+    # Unauthenticated requests have no role and therefore no permissions
+    ctx = _perm_ctx()
+    return ctx is not None and bool(ctx.perm_mask & _PERM_BITS.get(permission, 0))
 
-    # Get user role
-    role = g.user.role.value
 
-    # Check if user has the permission
-    return permission in PERMISSIONS.get(role, set())
+def _check_auth_and_role(ctx: Optional[_PermCtx], perm_bit: int) -> Optional[Response]:
+    """Return the denial for a missing user or a role without the permission, else None"""
+    if ctx is None:
+        return _denied(_AUTH_REQUIRED, 401)
+    if not ctx.perm_mask & perm_bit:
+        return _denied(_PERMISSION_DENIED, 403)
+    return None
 
 
-def require_permission(permission: str, get_resource_id: Optional[Callable] = None):
+def _perm_bit(permission: str) -> int:
+    """Resolve a permission's bit; unknown permissions are denied to every role but admin"""
+    return _PERM_BITS.get(sys.intern(permission), 0)
+
+
+def require_own_permission(permission: str, get_resource_id: Callable):
     """
-    Decorator to check if user has a specific permission
+    Decorator to check a permission and that the user owns the requested resource
+    
+    Args:
+        permission: Permission to check
+        get_resource_id: Function returning the owner ID of the requested resource
+    """
+    perm_bit = _perm_bit(permission)
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            ctx = _perm_ctx()
+
+            # Admin always has access, enum members are singletons so identity is enough
+            if ctx is None or ctx.role is not _ADMIN:
+                denial = _check_auth_and_role(ctx, perm_bit)
+                if denial is not None:
+                    return denial
+
+                if ctx.user_id != str(get_resource_id(request, kwargs)):
+                    return _denied(_NOT_OWNER, 403)
+
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def require_assigned_permission(permission: str):
+    """
+    Decorator to check a permission and that the thesis on g is assigned to the user
     
     Args:
         permission: Permission to check
-        get_resource_id: Optional function to get resource ID for ownership checks
     """
+    perm_bit = _perm_bit(permission)
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            ctx = _perm_ctx()
+
+            if ctx is None or ctx.role is not _ADMIN:
+                denial = _check_auth_and_role(ctx, perm_bit)
+                if denial is not None:
+                    return denial
+
+                # Only enforced once a thesis has been loaded for this request
+                thesis = getattr(g, 'thesis', None)
+                if thesis is not None and (not thesis.advisor_id or ctx.user_id != str(thesis.advisor_id)):
+                    return _denied(_NOT_ASSIGNED, 403)
+
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _require_role_permission(permission: str):
+    """Decorator checking only that the user's role has the permission"""
+    perm_bit = _perm_bit(permission)
+
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Check if user is authenticated
-            if not hasattr(g, 'user'):
-                return jsonify({
-                    "error": "Authentication required",
-                    "message": "You must be logged in to access this resource"
-                }), 401
-
-            # Get user role
-            role = g.user.role.value
-
-            # Admin always has access
-            if role == UserRole.ADMIN.value:
-                return func(*args, **kwargs)
-
-            # Check permission based on role
-            if permission not in PERMISSIONS.get(role, set()):
-                return jsonify({
-                    "error": "Permission denied",
-                    "message": "You do not have permission to access this resource"
-                }), 403
-
-            # If permission is for "own" resources, check ownership
-            if permission.endswith("_own") and get_resource_id:
-                resource_id = get_resource_id(request, kwargs)
-                if str(g.user.id) != str(resource_id):
-                    return jsonify({
-                        "error": "Permission denied",
-                        "message": "You can only access your own resources"
-                    }), 403
-
-            # If permission is for "assigned" resources, check assignment
-            if permission.endswith("_assigned") and get_resource_id and hasattr(g, 'thesis'):
-                if not g.thesis.advisor_id or str(g.user.id) != str(g.thesis.advisor_id):
-                    return jsonify({
-                        "error": "Permission denied",
-                        "message": "You can only access theses assigned to you"
-                    }), 403
-
-            # Permission granted, proceed to the route
+            ctx = _perm_ctx()
+
+            if ctx is None or ctx.role is not _ADMIN:
+                denial = _check_auth_and_role(ctx, perm_bit)
+                if denial is not None:
+                    return denial
+
             return func(*args, **kwargs)
 
         return wrapper
@@ -137,14 +235,34 @@ def require_permission(permission: str, get_resource_id: Optional[Callable] = No
     return decorator
 
 
-def get_user_permissions(role: UserRole) -> List[str]:
+def require_permission(permission: str, get_resource_id: Optional[Callable] = None):
+    """
+    Decorator to check if user has a specific permission
+    
+    Picks the ownership or assignment variant from the permission suffix,
+    so each route only runs the checks it needs.
+    
+    Args:
+        permission: Permission to check
+        get_resource_id: Optional function to get resource ID for ownership checks
+    """
+    if get_resource_id is not None:
+        if permission.endswith("_own"):
+            return require_own_permission(permission, get_resource_id)
+        if permission.endswith("_assigned"):
+            return require_assigned_permission(permission)
+    return _require_role_permission(permission)
+
+
+@lru_cache(maxsize=None)
+def get_user_permissions(role: UserRole) -> Tuple[str, ...]:
     """
-    Get a list of permissions for a specific role
+    Get the permissions for a specific role
     
     Args:
         role: User role
         
     Returns:
-        List of permissions
+        Tuple of permissions, shared between calls
     """
-    return list(PERMISSIONS.get(role.value, set()))
+    return tuple(PERMISSIONS_BY_ROLE.get(role, _EMPTY))